@@ -12,6 +12,6 @@ with open(join(dirname(__file__), 'parset_user_options.json')) as parset_options
 
 # from .tapdatabase import ObsDatabase
 from .sqldatabase import ParsetDataBase
-from .parset import Parset, ParsetUser
+from .parset import Parset, ParsetUser, convert_many
 # from .pointing_obs import *
 from .obs_config import *
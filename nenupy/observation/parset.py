@@ -18,21 +18,29 @@ __status__ = 'Production'
 __all__ = [
     '_ParsetProperty',
     'Parset',
+    'convert_many',
     'ParsetUser'
 ]
 
 
 from os.path import abspath, isfile, join, basename, dirname
-from collections.abc import MutableMapping
-from copy import deepcopy
 from typing import Tuple, Callable
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import re
+import io
+import itertools
 import json
 from astropy.time import Time, TimeDelta
-from astropy.coordinates import SkyCoord, AltAz, ICRS
+from astropy.coordinates import SkyCoord, AltAz, ICRS, Angle
 import astropy.units as u
 # from ipywidgets.widgets.widget_output import Output
 import numpy as np
+try:
+    import orjson
+except ImportError:
+    # Faster JSON serialization not available, fall back on json
+    orjson = None
 
 from nenupy import nenufar_position
 from nenupy.instru import sb2freq
@@ -45,102 +53,195 @@ log = logging.getLogger(__name__)
 
 
 SB_WIDTH = 195.3125*u.kHz
+_ISO_TIME_RE = re.compile(r'^\s*\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}')
+_IDX_RE = re.compile(r'\[(\d*)\]')
+_DUR_RE = re.compile(r"(?P<value>\d+)(?P<unit>[smh])")
+_UNQUOTE_TABLE = str.maketrans('', '', '\n"')
+_TRUE_TOKENS = frozenset({'on', 'enable', 'true'})
+_FALSE_TOKENS = frozenset({'off', 'disable', 'false'})
+_ANGLE_KEYS = frozenset({'angle1', 'angle2'})
+
+
+def _to_time(value: str):
+    """ Converts ``value`` to a :class:`~astropy.time.Time` instance
+        if it looks like an ISO date, returns it unchanged otherwise.
+    """
+    if _ISO_TIME_RE.match(value) is None:
+        return value
+    try:
+        return Time(value.strip(), precision=0)
+    except ValueError:
+        return value
+
+
+def _parse_value(key: str, value: str):
+    """ Converts a raw parset ``value`` string to the
+        corresponding Python object, depending on its syntax
+        (lists, subband ranges, booleans, angles, integers
+        or times).
+    """
+    value = value.translate(_UNQUOTE_TABLE)
+    value_lower = value.lower()
+
+    if value[:1] == '[' and value.endswith(']'):
+        # This is a list
+        items = value[1:-1].split(',')
+        value = []
+        # Parse according to syntax
+        for item in items:
+            if '..' in item:
+                # This is a subband syntax
+                sb_start, sb_stop = map(int, item.split('..'))
+                value.extend(range(sb_start, sb_stop + 1))
+            elif ':' in item:
+                # Might be a time object
+                value.append(_to_time(item))
+            elif item.isdigit():
+                # Integers (there are not list of floats)
+                value.append(int(item))
+            else:
+                # A simple string
+                value.append(item)
+
+    elif value_lower in _TRUE_TOKENS:
+        # This is a 'True' boolean
+        value = True
+
+    elif value_lower in _FALSE_TOKENS:
+        # This is a 'False' boolean
+        value = False
+    
+    elif key in _ANGLE_KEYS:
+        # This is a float angle in degrees
+        value = float(value) * u.deg
+    
+    elif value.isdigit():
+        value = int(value)
+    
+    elif ':' in value:
+        # Might be a time object
+        value = _to_time(value)
+
+    else:
+        pass
+
+    return value
 
 
 # ============================================================= #
 # ---------------------- _ParsetProperty ---------------------- #
 # ============================================================= #
-class _ParsetProperty(MutableMapping):
+class _ParsetProperty(dict):
     """ Class which mimics a dictionnary object, adapted to
         store parset metadata per category. It understands the
         different data types from raw strings it can encounter.
     """
 
+    __slots__ = ("_time_cache", "_freq_cache")
+
     def __init__(self, data=()):
-        self.mapping = {}
+        super().__init__()
+        self._time_cache = None
+        self._freq_cache = {}
         self.update(data)
 
-    def __getitem__(self, key):
-        return self.mapping[key]
-
-    def __delitem__(self, key):
-        del self.mapping[key]
-
     def __setitem__(self, key, value):
         """
         """
-        value = value.replace('\n', '')
-        value = value.replace('"', '')
-
-        if value.startswith('[') and value.endswith(']'):
-            # This is a list
-            val = value[1:-1].split(',')
-            value = []
-            # Parse according to syntax
-            for i in range(len(val)):
-                if '..' in val[i]:
-                    # This is a subband syntax
-                    subBandSart, subBanStop = val[i].split('..')
-                    value.extend(
-                        list(
-                            range(
-                                int(subBandSart),
-                                int(subBanStop) + 1
-                            )
-                        )
-                    )
-                elif ':' in val[i]:
-                    # Might be a time object
-                    try:
-                        item = Time(val[i].strip(), precision=0)
-                    except ValueError:
-                        item = val[i]
-                    value.append(item)
-                elif val[i].isdigit():
-                    # Integers (there are not list of floats)
-                    value.append(int(val[i]))
-                else:
-                    # A simple string
-                    value.append(val[i])
+        value = _parse_value(key, value)
 
-        elif value.lower() in ['on', 'enable', 'true']:
-            # This is a 'True' boolean
-            value = True
+        # if key in self:
+        #     del self[self[key]]
 
-        elif value.lower() in ['off', 'disable', 'false']:
-            # This is a 'False' boolean
-            value = False
-        
-        elif 'angle' in key.lower():
-            # This is a float angle in degrees
-            value = float(value) * u.deg
-        
-        elif value.isdigit():
-            value = int(value)
-        
-        elif ':' in value:
-            # Might be a time object
-            try:
-                value = Time(value.strip(), precision=0)
-            except ValueError:
-                pass
+        self._invalidate(key)
+        super().__setitem__(key, value)
+
+    def _invalidate(self, key):
+        """ Clears the cached data depending on ``key``. """
+        if key in ['startTime', 'duration']:
+            # Invalidate the times computed by _beam_times
+            self._time_cache = None
+        # Invalidate the frequencies computed by _freq_dict_cached
+        self._freq_cache.pop(key, None)
 
+    def __delitem__(self, key):
+        self._invalidate(key)
+        super().__delitem__(key)
+
+    def pop(self, key, *default):
+        self._invalidate(key)
+        return super().pop(key, *default)
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._invalidate(key)
+        return key, value
+
+    def clear(self):
+        self._time_cache = None
+        self._freq_cache.clear()
+        super().clear()
+
+    def update(self, data=(), **kwargs):
+        # dict.update does not go through __setitem__
+        if hasattr(data, "keys"):
+            for key in data.keys():
+                self[key] = data[key]
         else:
-            pass
-        
-        # if key in self:
-        #     del self[self[key]]
+            for key, value in data:
+                self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
 
-        self.mapping[key] = value
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
 
-    def __iter__(self):
-        return iter(self.mapping)
+    def __ior__(self, other):
+        # Values are parsed and the caches invalidated by update
+        self.update(other)
+        return self
 
-    def __len__(self):
-        return len(self.mapping)
+    @property
+    def mapping(self) -> dict:
+        """ Kept for backward compatibility, the instance is the mapping. """
+        return self
 
     def __repr__(self):
-        return f'{type(self).__name__}({self.mapping})'
+        return f'{type(self).__name__}({dict.__repr__(self)})'
+
+    def __copy__(self):
+        """ Shallow copy, values are already parsed and are not
+            modified in place.
+        """
+        new = type(self)()
+        dict.update(new, self)
+        new._time_cache = self._time_cache
+        new._freq_cache = self._freq_cache.copy()
+        return new
+
+    def copy(self):
+        return self.__copy__()
+
+    def __reduce__(self):
+        """ Pickling (and deep copy) support: the values are
+            already parsed and must not go through ``__setitem__``
+            again.
+        """
+        return (
+            _restore_parset_property,
+            (type(self), dict(self), self._time_cache, self._freq_cache)
+        )
+
+
+def _restore_parset_property(cls, items: dict, time_cache, freq_cache) -> _ParsetProperty:
+    """ Rebuilds a :class:`_ParsetProperty` from its parsed items. """
+    new = cls()
+    dict.update(new, items)
+    new._time_cache = time_cache
+    new._freq_cache = freq_cache
+    return new
 # ============================================================= #
 # ============================================================= #
 
@@ -154,31 +255,51 @@ def _parse_parameters(parameters: str, pulsar: bool = False) -> Tuple[str, dict]
         E.g. 'TF: DF=3.05 DT=10.0 HAMM'
     """
     parameters = parameters.lower()
-    mode = parameters.split(':')[0]
-    if pulsar:
-        configs = {
-            param.split('=')[0]: param.split('=')[1]\
-            for param in parameters.split('--')\
-            if '=' in param
-        }
-        configs.update({
-            param.rstrip(): True\
-            for param in parameters.split('--')\
-            if '=' not in param
-        })
-    else:
-        configs = {
-            param.split('=')[0]: param.split('=')[1]\
-            for param in parameters.split()\
-            if '=' in param
-        }
-        configs.update({
-            param.rstrip(): True\
-            for param in parameters.split('--')\
-            if '=' not in param
-        })
+    mode = parameters.partition(':')[0]
+    configs = {}
+    flags = {}
+    for param in parameters.split('--'):
+        if '=' not in param:
+            # Flags, e.g. '--DEFARADAY'
+            flags[param.rstrip()] = True
+            continue
+        # Pulsar 'key=value' pairs are separated by '--', the others by spaces
+        for pair in ((param,) if pulsar else param.split()):
+            key, equal, value = pair.partition('=')
+            if equal:
+                configs[key] = value.partition('=')[0]
+    # Flags prevail over the pairs sharing the same key
+    configs.update(flags)
     return mode, configs
 
+def _beam_times(property: _ParsetProperty) -> Tuple[Time, Time, Time, TimeDelta]:
+    """ Returns the start, stop and mid times as well as the
+        duration of a beam. They are computed once and cached
+        on ``property``.
+    """
+    if property._time_cache is None:
+        duration = TimeDelta(property['duration'] , format='sec')
+        start_time = property['startTime']
+        property._time_cache = (
+            start_time,
+            start_time + duration,
+            start_time + duration/2.,
+            duration
+        )
+    return property._time_cache
+
+@lru_cache(maxsize=128)
+def _solar_system_target(name: str, jd1: float, jd2: float, scale: str = "utc") -> SolarSystemTarget:
+    """ Returns the Solar System target ``name`` at the exact
+        two-part Julian date ``jd1 + jd2`` (see
+        :attr:`~astropy.time.Time.jd1`), so that beams tracking the
+        same body at the same time share the ephemeris.
+    """
+    return SolarSystemTarget.from_name(
+        name=name,
+        time=Time(jd1, jd2, format="jd", scale=scale)
+    )
+
 def _array_to_dict_array(array: list, unit: str = "") -> list:
     """ """
     if unit != "":
@@ -190,27 +311,164 @@ def _array_to_dict_array(array: list, unit: str = "") -> list:
             {"value": val} for val in array
         ]
 
-def _get_pointing_center_dict(property: _ParsetProperty) -> dict:
-    """ Returns a RA, Dec whatever the pointing type is. """
-
-    def _constrain_angle(
-            angle: u.Quantity,
-            valmin: u.Quantity = 0.*u.deg,
-            valmax: u.Quantity = 90*u.deg
-        ):
-        """ Constrain an angle between two values. """
-        if angle < valmin:
-            angle = valmin 
-        elif angle > valmax:
-            angle = valmax
-        else:
-            pass
-        return angle
+def _get_pointing_centers(properties: list) -> list:
+    """ Computes the equatorial coordinates of every pointing
+        described in horizontal coordinates (or requiring a
+        horizontal shift) within a single vectorized transformation.
+        Returns a list aligned with ``properties`` of (RA, Dec)
+        tuples in degrees, before any 'decal_ra'/'decal_dec' shift,
+        or ``None`` wherever :func:`_get_pointing_center_dict` should
+        compute the coordinates on its own.
+    """
+    radecs = [None] * len(properties)
 
-    # Sort out the beam start and stop times
-    duration = TimeDelta(property['duration'] , format='sec')
-    start_time = property['startTime']
-    stop_time = (property['startTime'] + duration)
+    # Sort out the pointings requiring an AltAz to ICRS conversion
+    azel_indices = []
+    j2000_indices = []
+    for i, property in enumerate(properties):
+        if "azelFile" in property:
+            # Treated as a zenith pointing, see _get_pointing_center_dict
+            property["directionType"] = "azelgeo_azelfile"
+        direction_type = property["directionType"].lower()
+        if direction_type in ["azelgeo", "azelgeo_azelfile"]:
+            azel_indices.append(i)
+        elif (direction_type == "j2000") and (("decal_az" in property) or ("decal_el" in property)):
+            j2000_indices.append(i)
+    indices = azel_indices + j2000_indices
+    if len(indices) == 0:
+        return radecs
+
+    # Stack the beam mid times
+    start_times = Time([properties[i]["startTime"] for i in indices])
+    durations = TimeDelta([properties[i]["duration"] for i in indices], format="sec")
+    mid_times = start_times + durations/2.
+
+    # Horizontal coordinates, zenith is the default (i.e. for azelfiles)
+    azimuth = np.zeros(len(indices))
+    elevation = np.full(len(indices), 90.)
+    n_azel = len(azel_indices)
+    for j, i in enumerate(azel_indices):
+        if properties[i]["directionType"].lower() == "azelgeo":
+            azimuth[j] = properties[i]["angle1"].to_value(u.deg)
+            elevation[j] = properties[i]["angle2"].to_value(u.deg)
+    if len(j2000_indices) > 0:
+        altaz = SkyCoord(
+            u.Quantity([properties[i]["angle1"] for i in j2000_indices]),
+            u.Quantity([properties[i]["angle2"] for i in j2000_indices])
+        ).transform_to(
+            AltAz(
+                obstime=mid_times[n_azel:],
+                location=nenufar_position
+            )
+        )
+        azimuth[n_azel:] = altaz.az.deg
+        elevation[n_azel:] = altaz.alt.deg
+
+    # Apply the horizontal shifts
+    for j, i in enumerate(indices):
+        if properties[i]["directionType"].lower() == "azelgeo_azelfile":
+            continue
+        azimuth[j] += float(properties[i].get("decal_az", 0.0))
+        elevation[j] += float(properties[i].get("decal_el", 0.0))
+
+    # Convert everything at once
+    radec = SkyCoord(
+        Angle(azimuth*u.deg).wrap_at(360*u.deg),
+        np.clip(elevation, 0., 90.)*u.deg,
+        frame=AltAz(
+            obstime=mid_times,
+            location=nenufar_position
+        )
+    ).transform_to(ICRS)
+    for i, ra, dec in zip(indices, radec.ra.deg, radec.dec.deg):
+        radecs[i] = (ra, dec)
+
+    return radecs
+
+def _shifted_altaz_to_icrs(az: u.Quantity, alt: u.Quantity, decal_az: float, decal_el: float, obstime: Time) -> SkyCoord:
+    """ Applies the horizontal shift to ``az``, ``alt`` and converts them to ICRS. """
+    return SkyCoord(
+        Angle(az + (decal_az or 0.0)*u.deg).wrap_at(360*u.deg),
+        np.clip((alt + (decal_el or 0.0)*u.deg).to_value(u.deg), 0., 90.)*u.deg,
+        frame=AltAz(
+            obstime=obstime,
+            location=nenufar_position
+        )
+    ).transform_to(ICRS)
+
+def _pc_j2000(prop, mid_time, decal_ra, decal_dec, decal_az, decal_el) -> Tuple[float, float]:
+    if (decal_az is None) and (decal_el is None):
+        # Fast path, the coordinates are already equatorial
+        return (
+            np.clip(prop['angle1'].to_value(u.deg) + decal_ra, 0., 360.),
+            np.clip(prop['angle2'].to_value(u.deg) + decal_dec, -90., 90.)
+        )
+    altaz = SkyCoord(prop['angle1'], prop['angle2']).transform_to(
+        AltAz(
+            obstime=mid_time,
+            location=nenufar_position
+        )
+    )
+    radec = _shifted_altaz_to_icrs(altaz.az, altaz.alt, decal_az, decal_el, mid_time)
+    return (
+        np.clip(radec.ra.deg + decal_ra, 0., 360.),
+        np.clip(radec.dec.deg + decal_dec, -90., 90.)
+    )
+
+def _pc_azelgeo(prop, mid_time, decal_ra, decal_dec, decal_az, decal_el) -> Tuple[float, float]:
+    # This is a transit observation, compute the mean RA/Dec
+    radec = _shifted_altaz_to_icrs(prop['angle1'], prop['angle2'], decal_az, decal_el, mid_time)
+    return (
+        np.clip(radec.ra.deg + decal_ra, 0., 360.),
+        np.clip(radec.dec.deg + decal_dec, -90., 90.)
+    )
+
+def _pc_azelgeo_azelfile(prop, mid_time, decal_ra, decal_dec, decal_az, decal_el) -> Tuple[float, float]:
+    # This observation was made using an azelfile
+    radec = SkyCoord(
+        0.*u.deg,
+        90*u.deg,
+        frame=AltAz(
+            obstime=mid_time,
+            location=nenufar_position
+        )
+    ).transform_to(ICRS)
+    return radec.ra.deg, radec.dec.deg
+
+def _pc_natif(prop, mid_time, decal_ra, decal_dec, decal_az, decal_el) -> Tuple[float, float]:
+    # This is a test observation, unable to parse the RA/Dec
+    return None, None
+
+def _pc_solar(prop, mid_time, decal_ra, decal_dec, decal_az, decal_el) -> Tuple[float, float]:
+    # Dealing with a Solar System source
+    solar_system_target = _solar_system_target(
+        name=prop['directionType'].lower(),
+        jd1=mid_time.jd1,
+        jd2=mid_time.jd2,
+        scale=mid_time.scale
+    )
+    radec = solar_system_target.coordinates
+    if (decal_az is not None) or (decal_el is not None):
+        altaz = solar_system_target.horizontal_coordinates[0]
+        # obstime consistent with the cached target time
+        radec = _shifted_altaz_to_icrs(altaz.az, altaz.alt, decal_az, decal_el, altaz.obstime)
+    return (
+        np.clip(radec.ra.deg + decal_ra, 0., 360.),
+        np.clip(radec.dec.deg + decal_dec, -90., 90.)
+    )
+
+_PC_HANDLERS = {
+    "j2000": _pc_j2000,
+    "azelgeo": _pc_azelgeo,
+    "azelgeo_azelfile": _pc_azelgeo_azelfile,
+    "natif": _pc_natif
+}
+
+def _get_pointing_center_dict(property: _ParsetProperty, radec: Tuple[float, float] = None) -> dict:
+    """ Returns a RA, Dec whatever the pointing type is.
+        If ``radec`` is given (as computed by :func:`_get_pointing_centers`),
+        the coordinate transformations are skipped.
+    """
 
     if "azelFile" in property:
         # In case of pointing described by an azelfile
@@ -219,132 +477,28 @@ def _get_pointing_center_dict(property: _ParsetProperty) -> dict:
 
     # Deal with coordinates and pointing types
     direction_type = property['directionType'].lower()
-    if direction_type == "j2000":
-        ra = property['angle1'].to(u.deg)
-        dec = property['angle2'].to(u.deg)
-        if ("decal_az" in property) or ("decal_el" in property):
-            altaz = SkyCoord(ra, dec).transform_to(
-                AltAz(
-                    obstime=start_time + duration/2.,
-                    location=nenufar_position
-                )
-            )
-            radec = SkyCoord(
-                _constrain_angle(
-                    altaz.az + float(property.get("decal_az", 0.0))*u.deg,
-                    valmin=0.*u.deg,
-                    valmax=360.*u.deg
-                ),
-                _constrain_angle(
-                    altaz.alt + float(property.get("decal_el", 0.0))*u.deg,
-                    valmin=0.*u.deg,
-                    valmax=90.*u.deg
-                ),
-                frame=AltAz(
-                    obstime=start_time + duration/2.,
-                    location=nenufar_position
-                )
-            ).transform_to(ICRS)
-            ra = radec.ra
-            dec = radec.dec
-        # Nothing else to do
-        decal_ra = float(property.get("decal_ra", 0.0))*u.deg
-        decal_dec = float(property.get("decal_dec", 0.0))*u.deg
-        right_ascension = _constrain_angle(
-            (ra + decal_ra).value,
-            valmin=0.,
-            valmax=360.
-        )
-        declination = _constrain_angle(
-            (dec + decal_dec).value,
-            valmin=-90.,
-            valmax=90.
-        )
+    decal_ra = float(property.get("decal_ra", 0.0))
+    decal_dec = float(property.get("decal_dec", 0.0))
 
-    elif direction_type == "azelgeo":
-        # This is a transit observation, compute the mean RA/Dec
-        # Convert AltAz to RA/Dec
-        radec = SkyCoord(
-            _constrain_angle(
-                property['angle1'] + float(property.get("decal_az", 0.0))*u.deg,
-                valmin=0.*u.deg,
-                valmax=360.*u.deg
-            ),
-            _constrain_angle(
-                property['angle2'] + float(property.get("decal_el", 0.0))*u.deg,
-                valmin=0.*u.deg,
-                valmax=90.*u.deg
-            ),
-            frame=AltAz(
-                obstime=start_time + duration/2.,
-                location=nenufar_position
-            )
-        ).transform_to(ICRS)
-        right_ascension = _constrain_angle(
-            radec.ra.deg + float(property.get("decal_ra", 0.0)),
-            valmin=0.,
-            valmax=360.
-        )
-        declination = _constrain_angle(
-            radec.dec.deg + float(property.get("decal_dec", 0.0)),
-            valmin=-90.,
-            valmax=90.
-        )
-    
-    elif direction_type == "azelgeo_azelfile":
-        # This observation was made using an azelfile
-        radec = SkyCoord(
-            0.*u.deg,
-            90*u.deg,
-            frame=AltAz(
-                obstime=start_time + duration/2.,
-                location=nenufar_position
-            )
-        ).transform_to(ICRS)
-        right_ascension = radec.ra.deg
-        declination = radec.dec.deg
-    
-    elif direction_type == "natif":
-        # This is a test observation, unable to parse the RA/Dec
-        right_ascension = None
-        declination = None
+    if (radec is not None) and (direction_type == "azelgeo_azelfile"):
+        right_ascension, declination = radec
+
+    elif radec is not None:
+        # Coordinates already converted, only the equatorial shift remains
+        right_ascension = np.clip(radec[0] + decal_ra, 0., 360.)
+        declination = np.clip(radec[1] + decal_dec, -90., 90.)
 
     else:
-        # Dealing with a Solar System source
-        solar_system_target = SolarSystemTarget.from_name(
-            name=direction_type,
-            time=start_time + duration/2.
-        )
-        radec = solar_system_target.coordinates
-        if ("decal_az" in property) or ("decal_el" in property):
-            altaz = solar_system_target.horizontal_coordinates[0]
-            radec = SkyCoord(
-                _constrain_angle(
-                    altaz.az + float(property.get("decal_az", 0.0))*u.deg,
-                    valmin=0.*u.deg,
-                    valmax=360.*u.deg
-                ),
-                _constrain_angle(
-                    altaz.alt + float(property.get("decal_el", 0.0))*u.deg,
-                    valmin=0.*u.deg,
-                    valmax=90.*u.deg
-                ),
-                frame=AltAz(
-                    obstime=start_time + duration/2.,
-                    location=nenufar_position
-                )
-            ).transform_to(ICRS)
-        decal_ra = float(property.get("decal_ra", 0.0))*u.deg
-        decal_dec = float(property.get("decal_dec", 0.0))*u.deg
-        right_ascension = _constrain_angle(
-            radec.ra.deg + decal_ra.value,
-            valmin=0.,
-            valmax=360.
-        )
-        declination = _constrain_angle(
-            radec.dec.deg + decal_dec.value,
-            valmin=-90.,
-            valmax=90.
+        decal_az = property.get("decal_az")
+        decal_el = property.get("decal_el")
+        handler = _PC_HANDLERS.get(direction_type, _pc_solar)
+        right_ascension, declination = handler(
+            property,
+            _beam_times(property)[2], # mid time
+            decal_ra,
+            decal_dec,
+            None if decal_az is None else float(decal_az),
+            None if decal_el is None else float(decal_el)
         )
 
     return {
@@ -356,15 +510,13 @@ def _get_pointing_center_dict(property: _ParsetProperty) -> dict:
             "value": declination,
             "unit": "deg"
         },
-        "obs_direction_type": property["directionType"].lower()
+        "obs_direction_type": direction_type
     }
 
 def _get_time_dict(property: _ParsetProperty) -> dict:
     """ """
     # Sort out the beam start and stop times
-    duration = TimeDelta(property['duration'] , format='sec')
-    start_time = property['startTime']
-    stop_time = (property['startTime'] + duration)
+    start_time, stop_time, _, duration = _beam_times(property)
     return {
         "startstop":
             {
@@ -372,29 +524,61 @@ def _get_time_dict(property: _ParsetProperty) -> dict:
                 "lte": stop_time.isot
             },
         "duration": {
-            "value": np.round(duration.sec, 3),
+            "value": round(float(duration.sec), 3),
             "unit": "s"
         }
     }
 
+def _rle_boundaries(sb: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """ Returns the start and stop indices of the runs of
+        consecutive values in ``sb``.
+    """
+    if sb.size == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    changes = np.concatenate(([True], np.diff(sb) != 1))
+    starts = np.nonzero(changes)[0]
+    stops = np.r_[starts[1:], sb.size]
+    return starts, stops
+
 def _get_frequency_dict(property: _ParsetProperty, field: str = "subbandList") -> dict:
         """ """
-        subband_list = property[field]
-        # Find consecutive subbands groups:
-        subband_list_groups = np.split(
-            subband_list,
-            np.where(np.diff(subband_list) != 1)[0] + 1
-        )
+        subband_list = np.asarray(property[field])
+        frequencies = sb2freq(subband_list).to_value(u.MHz)
+        sb_width = SB_WIDTH.to_value(u.MHz)
+        # Find consecutive subbands groups boundaries
+        starts, stops = _rle_boundaries(subband_list)
         return [
             {
                 "value": {
-                    "gte": sb2freq(group.min())[0].to(u.MHz).value,
-                    "lt": (sb2freq(group.max()) + SB_WIDTH)[0].to(u.MHz).value,
+                    "gte": frequencies[start],
+                    "lt": frequencies[stop - 1] + sb_width,
                 },
                 "unit": "MHz"
-            } for group in subband_list_groups
+            } for start, stop in zip(starts, stops)
         ]
 
+def _freq_dict_cached(property: _ParsetProperty, field: str = "subbandList") -> dict:
+    """ Same as :func:`_get_frequency_dict`, the frequency ranges
+        are cached on ``property`` (as immutable ``(gte, lt)`` pairs)
+        until ``field`` is modified. New dictionaries are returned at
+        each call, so that the caller may modify them.
+    """
+    if field not in property._freq_cache:
+        property._freq_cache[field] = tuple(
+            (freq["value"]["gte"], freq["value"]["lt"])
+            for freq in _get_frequency_dict(property, field=field)
+        )
+    return [
+        {
+            "value": {
+                "gte": gte,
+                "lt": lt
+            },
+            "unit": "MHz"
+        } for gte, lt in property._freq_cache[field]
+    ]
+
 def _default_setting(digibeam: _ParsetProperty, output: _ParsetProperty, version: tuple) -> dict:
     return {
         "name": "LaNewBa",
@@ -406,7 +590,7 @@ def _default_setting(digibeam: _ParsetProperty, output: _ParsetProperty, version
             "value": SB_WIDTH.to(u.kHz).value,
             "unit": "kHz"
         },
-        "frequency": _get_frequency_dict(digibeam, field="subbandList")
+        "frequency": _freq_dict_cached(digibeam, field="subbandList")
     }
 
 def _pulsar_setting(digibeam: _ParsetProperty, output: _ParsetProperty, version: tuple) -> dict:
@@ -426,7 +610,7 @@ def _pulsar_setting(digibeam: _ParsetProperty, output: _ParsetProperty, version:
             "mode": "pulsar_fold",
             "source_name": config["src"].rstrip(),
             "n_polars": 1 if config.get("onlyi", False) else 4,
-            "frequency": _get_frequency_dict(digibeam, field="subbandList")
+            "frequency": _freq_dict_cached(digibeam, field="subbandList")
         }
     elif mode == "single":
         return {
@@ -435,21 +619,21 @@ def _pulsar_setting(digibeam: _ParsetProperty, output: _ParsetProperty, version:
             "source_name": config["src"].rstrip(),
             "downsampling": int(config["dstime"]),
             "n_polars": 1 if config.get("onlyi", False) else 4,
-            "frequency": _get_frequency_dict(digibeam, field="subbandList")
+            "frequency": _freq_dict_cached(digibeam, field="subbandList")
         }
     elif mode == "waveolaf":
         return {
             "name": "undysputed",
             "mode": "pulsar_waveolaf",
             "source_name": config["src"].rstrip(),
-            "frequency": _get_frequency_dict(digibeam, field="subbandList")
+            "frequency": _freq_dict_cached(digibeam, field="subbandList")
         }
     elif mode == "wave":
         return {
             "name": "undysputed",
             "mode": "pulsar_wave",
             "source_name": config["src"].rstrip(),
-            "frequency": _get_frequency_dict(digibeam, field="subbandList")
+            "frequency": _freq_dict_cached(digibeam, field="subbandList")
         }
     else:
         log.warning(f"Pulsar mode '{mode}' not recognized.")
@@ -459,7 +643,7 @@ def _waveform_setting(digibeam: _ParsetProperty, output: _ParsetProperty, versio
     return {
         "name": "undysputed",
         "mode": "waveform",
-        "frequency": _get_frequency_dict(digibeam, field="subbandList")
+        "frequency": _freq_dict_cached(digibeam, field="subbandList")
     }
 
 def _dynamicspectrum_setting(digibeam: _ParsetProperty, output: _ParsetProperty, version: tuple) -> dict:
@@ -490,7 +674,7 @@ def _dynamicspectrum_setting(digibeam: _ParsetProperty, output: _ParsetProperty,
                 "value": float(config["df"]),
                 "unit": "kHz"
             },
-            "frequency": _get_frequency_dict(digibeam, field="subbandList")
+            "frequency": _freq_dict_cached(digibeam, field="subbandList")
         }
     except KeyError:
         log.warning(
@@ -520,10 +704,10 @@ def _nickel_setting(phasecenter: _ParsetProperty, output: _ParsetProperty, versi
                 f"No 'parameters' for phase center {phasecenter['noBeam']})."
             )
             #return {}
-        nickel_config["frequency"] = _get_frequency_dict(phasecenter, "subbandList")
+        nickel_config["frequency"] = _freq_dict_cached(phasecenter, "subbandList")
         return nickel_config
     else:
-        nickel_config["frequency"] = _get_frequency_dict(output, "nri_subbandList")
+        nickel_config["frequency"] = _freq_dict_cached(output, "nri_subbandList")
         return nickel_config
 
 def _tbd_setting(digibeam: _ParsetProperty, output: _ParsetProperty, version: tuple) -> dict:
@@ -549,18 +733,27 @@ class _JsonEntry:
         self.output = output
         self.fovs = []
         self.pointings = []
+        self._fov_idx_map = {} # FoV 'idx' -> position in self.fovs
 
 
     @property
     def fov_indices(self) -> np.ndarray:
-        return np.array([fov["idx"] for fov in self.fovs])
+        return np.fromiter(self._fov_idx_map, dtype=np.int64, count=len(self._fov_idx_map))
 
 
     @property
     def data(self) -> dict:
         """ """
+        # Mini-Arrays are stored as arrays, convert them to JSON-like lists
+        fovs = [
+            {
+                **fov,
+                "pointings": [],
+                "mini_arrays": _array_to_dict_array(fov["mini_arrays"].tolist())
+            } for fov in self.fovs
+        ]
+
         # Fill the Field of Views with their associated pointings
-        fovs = self.fovs.copy()
         for fov_idx, pointing in self.pointings:
             fovs[fov_idx]["pointings"].append(pointing)
 
@@ -589,7 +782,7 @@ class _JsonEntry:
                   "lt": observation["stopTime"].isot
                },
             "duration": {
-                "value": np.round((observation["stopTime"] - observation["startTime"]).sec, 3),
+                "value": round(float((observation["stopTime"] - observation["startTime"]).sec), 3),
                 "unit": "s"
             }
         }
@@ -620,13 +813,13 @@ class _JsonEntry:
         self.obs_metadata["parset_user"] = parset_user
 
 
-    def add_field_of_view(self, index: int, anabeam: _ParsetProperty) -> None:
+    def add_field_of_view(self, index: int, anabeam: _ParsetProperty, radec: Tuple[float, float] = None) -> None:
         """ """
         fov = {}
         fov["idx"] = index
         fov["pointings"] = []
         fov["name"] = anabeam["target"]
-        fov["center"] = _get_pointing_center_dict(anabeam)
+        fov["center"] = _get_pointing_center_dict(anabeam, radec=radec)
         fov["time"] = _get_time_dict(anabeam)
         fov["beamsquint"] = {
             "correction": anabeam.get("beamSquint", False),
@@ -635,20 +828,21 @@ class _JsonEntry:
                 "unit": "MHz"
             }
         }
-        fov["mini_arrays"] = _array_to_dict_array(anabeam["maList"])
+        fov["mini_arrays"] = np.asarray(anabeam["maList"], dtype=np.int32) # converted in self.data
         fov["antennas"] = _array_to_dict_array(anabeam["antList"])
         fov["filter"] = [{"name": int(fil), "start": tim.isot} for fil, tim in zip(anabeam["filter"], anabeam["filterTime"])]
         self.fovs.append(fov)
+        self._fov_idx_map[index] = len(self.fovs) - 1
 
 
-    def add_pointing(self, index: int, beam: _ParsetProperty, parset_version: tuple, pointing_setting_func: Callable = None) -> None:
+    def add_pointing(self, index: int, beam: _ParsetProperty, parset_version: tuple, pointing_setting_func: Callable = None, radec: Tuple[float, float] = None) -> None:
         """ """
         pointing = {}
 
         # Mandatory keys
         pointing["idx"] = index
         pointing["name"] = beam["target"]
-        pointing["center"] = _get_pointing_center_dict(beam)
+        pointing["center"] = _get_pointing_center_dict(beam, radec=radec)
         pointing["time"] = _get_time_dict(beam)
 
         # Select the correct function to store the receiver configuration
@@ -658,7 +852,7 @@ class _JsonEntry:
         pointing["receiver"] = pointing_setting_func(beam, self.output, parset_version)
 
         # Assign the FoV index to each pointing
-        fov_idx = np.where(self.fov_indices == beam["noBeam"])[0][0]
+        fov_idx = self._fov_idx_map[beam["noBeam"]]
 
         self.pointings.append((fov_idx, pointing))
 
@@ -685,28 +879,38 @@ class _JsonEntry:
         # Get the last pointing index, before adding more
         last_pointing_idx = len(self.pointings) - 1
 
-        for i, fov in enumerate(self.fovs):
-            start = Time(fov["time"]["startstop"]["gte"])
-            duration = TimeDelta(fov["time"]["duration"]["value"], format="sec")
-            zenith = SkyCoord(
-                0, 90,
-                unit="deg",
-                frame=AltAz(
-                    obstime=start + duration/2,
-                    location=nenufar_position
-                )
-            ).transform_to(ICRS)
-            
+        if not self.fovs:
+            return
+
+        # Compute all the local zenith positions in one transformation
+        start = Time([fov["time"]["startstop"]["gte"] for fov in self.fovs])
+        duration = TimeDelta(
+            [fov["time"]["duration"]["value"] for fov in self.fovs],
+            format="sec"
+        )
+        n_fovs = len(self.fovs)
+        zenith = SkyCoord(
+            np.zeros(n_fovs), np.full(n_fovs, 90.),
+            unit="deg",
+            frame=AltAz(
+                obstime=start + duration/2,
+                location=nenufar_position
+            )
+        ).transform_to(ICRS)
+        zenith_ra = zenith.ra.deg
+        zenith_dec = zenith.dec.deg
+
+        for i, (fov, ra, dec) in enumerate(zip(self.fovs, zenith_ra, zenith_dec)):
             # Prepare the pointing configuration
             xst_pointing = {
                 "idx": last_pointing_idx + 1 + i,
                 "center": {
                     "ra": {
-                        "value": zenith.ra.deg,
+                        "value": ra,
                         "unit": "deg"
                     },
                     "dec": {
-                        "value": zenith.dec.deg,
+                        "value": dec,
                         "unit": "deg"
                     },
                     "obs_direction_type": "zenith_xst"
@@ -715,7 +919,8 @@ class _JsonEntry:
                 "time": fov["time"],
                 "receiver": {
                     "name": "LaNewBa",
-                    "frequency": _get_frequency_dict(self.output, field="xst_sbList")
+                    # Same cached frequencies, own dictionaries per pointing
+                    "frequency": _freq_dict_cached(self.output, field="xst_sbList")
                 }
             }
 
@@ -725,30 +930,43 @@ class _JsonEntry:
 
     def remove_unused_miniarrays(self) -> None:
         """ """
-        for fov in self.fovs:
-            # Check if remote MA are there, loop out if not
-            mas_in_fov = np.array([ma_in_fov["value"] for ma_in_fov in fov["mini_arrays"]])
-            if not np.any(mas_in_fov > 96):
+        # Find out the field of views having at least one pointing using NICKEL
+        # (pre-1.0 NICKEL pointings store their receiver settings at top level)
+        nickel_fovs = {
+            fov_idx for fov_idx, pointing in self.pointings
+            if pointing.get("receiver", pointing).get("name") == "nickel"
+        }
+
+        for i, fov in enumerate(self.fovs):
+            # Remote MA are needed if NICKEL is used
+            if i in nickel_fovs:
                 continue
 
-            # Find out the receivers used
-            for pointing in fov["pointings"]:
-                if "nickel" == pointing["receiver"]["name"]:
-                    # Check if one of the associated pointings implies NICKEL
-                    continue
+            # Check if remote MA are there, loop out if not
+            remote_mas_in_fov_mask = fov["mini_arrays"] > 96
+            if not np.any(remote_mas_in_fov_mask):
+                continue
 
             # Remove the remote Mini-Arrays
-            remote_mas_in_fov_mask = mas_in_fov > 96
-            fov["mini_arrays"] = np.array(fov["mini_arrays"])[~remote_mas_in_fov_mask].tolist()
+            fov["mini_arrays"] = fov["mini_arrays"][~remote_mas_in_fov_mask]
             log.info(
                 f"Remote Mini-Arrays have been removed for 'field_of_view' #{fov['idx']} because no associated 'pointing' is using the NICKEL receiver."
             )
 
 
     def save_file(self, file_name: str) -> None:
-        """ Writes the JSON file. """
-        with open(file_name, 'w', encoding='utf-8') as wf:
-            json.dump(self.data, wf, ensure_ascii=False, indent=4)
+        """ Writes the JSON file (using 'orjson' if installed). """
+        if orjson is None:
+            with open(file_name, 'w', encoding='utf-8') as wf:
+                json.dump(self.data, wf, ensure_ascii=False, indent=2)
+        else:
+            with open(file_name, 'wb') as wf:
+                wf.write(
+                    orjson.dumps(
+                        self.data,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                    )
+                )
         log.info(f"'{file_name}' written.")
 # ============================================================= #
 # ============================================================= #
@@ -812,63 +1030,61 @@ class Parset(object):
     # ------------------------ Methods ------------------------ #
     def to_json(self, path_name: str = None):
         """ """
-
-        parset_version = self.version
-
-        json_entry = _JsonEntry(output=self.output)
-
-        json_entry.add_observation_metadata(
-            observation=self.observation,
-            parset_file=self.parset,
-            parset_user=self.parset_user
-        )
-
-        # Parse and store every field of view = analog configurations
-        for ana_idx, anabeam in self.anabeams.items():
-            json_entry.add_field_of_view(ana_idx, anabeam)
-
-        # Parse and store every pointing = digital beam configurations
-        digi_idx = 0
-        for digi_idx, digibeam in self.digibeams.items():
-            json_entry.add_pointing(digi_idx, digibeam, parset_version)
-
-        # Parse and store every imaging pointing = phase center configurations
-        if parset_version >= (1, 0):
-            # These were introduced with parset version 1.0
-            for center_idx, phase_center in self.phase_centers.items():
-                pc_index = center_idx + digi_idx + 1
-                json_entry.add_pointing(pc_index, phase_center, parset_version)
-
-        # Add extra pointings in some specific cases
-        # If XST are used
-        if self.output.get("xst_userfile", False):
-            # Add a pointing per anabeam if XST data have been taken
-            json_entry.add_xst_pointings()
-        # If NICKEL is used, old parset versions
-        if parset_version < (1, 0):
-            if "nickel" in self.output.get("nri_receivers", []):
-                if "TBD" not in [beam["toDo"] for beam in self.digibeams.values()]:
-                    if len(self.anabeams) > 1:
-                        log.warning("Found more than 1 FoV. A NICKEL pointing is added for the first one ONLY.")
-
-                    # Add a NICKEL pointing corresponding to the analog beam
-                    index = len(json_entry.pointings)
-                    json_entry.add_nickel_pointing(anabeam=self.anabeams[0], index=index)
-
-        # Remove un-necessary Mini-Arrays indices
-        json_entry.remove_unused_miniarrays()
+        json_entry = self._json_entry()
 
         # Save or not the data to a file
         if path_name is not None:
-            json_file_name = basename(self.parset).replace(".parset", ".json")
-            json_file = join(path_name, json_file_name)
-            json_entry.save_file(file_name=json_file)
+            json_entry.save_file(file_name=self._json_file_name(path_name))
         else:
             return json_entry.data
 
 
-    def to_json_old(self, path_name=None):
-        """ """
+    @classmethod
+    def to_json_batch(cls, parset_files: list, path_name: str, max_workers: int = None) -> list:
+        """ Converts several parset files to JSON files written in
+            the ``path_name`` directory. The parsets are decoded one
+            after the other while the JSON files are written by a
+            pool of threads, overlapping the disk accesses with the
+            parsing of the next parset.
+
+            :param parset_files:
+                Parset files to convert.
+            :type parset_files:
+                `list` of `str`
+            :param path_name:
+                Directory where the JSON files are written.
+            :type path_name:
+                `str`
+            :param max_workers:
+                Maximum number of writing threads (see :class:`~concurrent.futures.ThreadPoolExecutor`).
+            :type max_workers:
+                `int`
+
+            :returns:
+                The written JSON file names.
+            :rtype:
+                `list` of `str`
+        """
+        json_files = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            for parset_file in parset_files:
+                parset = cls(parset_file)
+                json_file = parset._json_file_name(path_name)
+                futures.append(
+                    executor.submit(parset._json_entry().save_file, json_file)
+                )
+                json_files.append(json_file)
+            for future in futures:
+                # Raises the writing errors, if any
+                future.result()
+        return json_files
+
+
+    def to_json_old(self, path_name=None, pretty=False):
+        """ ``pretty`` indents the written JSON file, otherwise
+            it is written with compact separators.
+        """
         
         data = {}
         data["@timestamp"] = self.observation["startTime"].isot
@@ -936,37 +1152,39 @@ class Parset(object):
                     "unit": "MHz"
                 }
             }
-            # fov["mini_arrays"] = anabeam["maList"]
-            fov["mini_arrays"] = self._array_to_dict_array(anabeam["maList"])
-            # fov["antennas"] = anabeam["antList"]
-            fov["antennas"] = self._array_to_dict_array(anabeam["antList"])
+            # Raw arrays, converted to dicts once the fov is complete
+            fov["mini_arrays"] = np.asarray(anabeam["maList"], dtype=np.int32)
+            fov["antennas"] = np.asarray(anabeam["antList"], dtype=np.int32)
             fov["filter"] = [{"name": int(fil), "start": tim.isot} for fil, tim in zip(anabeam["filter"], anabeam["filterTime"])]
 
             data["field_of_views"].append(fov)
 
-        fov_indices = np.array([fov["idx"] for fov in data["field_of_views"]])
+        fov_by_idx = {fov["idx"]: fov for fov in data["field_of_views"]}
 
         for digi_idx, digibeam in self.digibeams.items():
+            to_do = digibeam["toDo"].lower() if "toDo" in digibeam else None
+
+            if to_do in ["pulsar", "dynamicspectrum"]:
+                try:
+                    mode, config = self._parse_parameters(digibeam["parameters"], pulsar=(to_do == "pulsar"))
+                except KeyError:
+                    log.warning(
+                        f"Parset '{self.parset}' doesn't have any 'parameters' for numerical beam {digibeam['noBeam']})."
+                    )
+                    continue
+
             pointing = {}
             pointing['idx'] = digi_idx
             pointing["name"] = digibeam["target"]
             pointing["center"] = self._get_pointing_center_dict(digibeam)
             pointing["time"] = self._get_time_dict(digibeam)
 
-            if "toDo" not in digibeam:
+            if to_do is None:
                 pointing["receiver"] = {
                     "name": "LaNewBa",
                     "frequency": self._get_frequency_dict(digibeam, field="subbandList")
                 }
-            elif digibeam["toDo"].lower() == "pulsar":
-                try:
-                    mode, config = self._parse_parameters(digibeam["parameters"], pulsar=True)
-                except KeyError:
-                    log.warning(
-                        f"Parset '{self.parset}' doesn't have any 'parameters' for numerical beam {digibeam['noBeam']})."
-                    )
-                    continue
-
+            elif to_do == "pulsar":
                 if mode == "fold":
                     pointing["receiver"] = {
                         "name": "undysputed",
@@ -1000,22 +1218,14 @@ class Parset(object):
                     }
                 else:
                     pointing["receiver_configuration"] = {}
-            elif digibeam["toDo"].lower() == "waveform":
+            elif to_do == "waveform":
                 pointing["receiver"] = {
                     "name": "undysputed",
                     "mode": "waveform",
                     #"source_name": config["src"],
                     "frequency": self._get_frequency_dict(digibeam, field="subbandList")
                 }
-            elif digibeam["toDo"].lower() == "dynamicspectrum":
-                try:
-                    _, config = self._parse_parameters(digibeam["parameters"], pulsar=False)
-                except KeyError:
-                    log.warning(
-                        f"Parset '{self.parset}' doesn't have any 'parameters' for numerical beam {digibeam['noBeam']})."
-                    )
-                    continue
-
+            elif to_do == "dynamicspectrum":
                 try:
                     pointing["receiver"] = {
                         "name": "undysputed",
@@ -1035,8 +1245,8 @@ class Parset(object):
                         f"Parset '{self.parset}' has a wrong '{digibeam['toDo']}' configuration."
                     )
                     continue
-            elif (digibeam["toDo"].lower() == "tbd") and ("nickel" in self.output.get("nri_receivers", [])):
-            # elif digibeam["toDo"].lower() == "imaging": # to be implemented?
+            elif (to_do == "tbd") and ("nickel" in self.output.get("nri_receivers", [])):
+            # elif to_do == "imaging": # to be implemented?
                 pointing["receiver"] = {
                     "name": "nickel",
                     "channelization": {
@@ -1051,37 +1261,38 @@ class Parset(object):
                 }           
 
             # Select the correct fov
-            idx = np.where(fov_indices == digibeam["noBeam"])[0][0]
-            associated_fov = data["field_of_views"][idx]
+            associated_fov = fov_by_idx[digibeam["noBeam"]]
             associated_fov["pointings"].append(pointing)
         
         # Add a pointing per anabeam if XST data have been taken
-        if self.output.get("xst_userfile", False):
-            for i, fov in enumerate(data["field_of_views"]):
-                start = Time(fov["time"]["startstop"]["gte"])
-                duration = TimeDelta(fov["time"]["duration"]["value"], format="sec")
-                zenith = SkyCoord(
-                    0, 90,
-                    unit="deg",
-                    frame=AltAz(
-                        obstime=start + duration/2,
-                        location=nenufar_position
-                    )
-                ).transform_to(ICRS)
-                try:
-                    last_dig_idx = digi_idx
-                except:
-                    last_dig_idx = -1
+        if self.output.get("xst_userfile", False) and (len(data["field_of_views"]) > 0):
+            # Compute all the local zenith positions in one transformation
+            fovs = data["field_of_views"]
+            start = Time([fov["time"]["startstop"]["gte"] for fov in fovs])
+            duration = TimeDelta([fov["time"]["duration"]["value"] for fov in fovs], format="sec")
+            zenith = SkyCoord(
+                np.zeros(len(fovs)), np.full(len(fovs), 90.),
+                unit="deg",
+                frame=AltAz(
+                    obstime=start + duration/2,
+                    location=nenufar_position
+                )
+            ).transform_to(ICRS)
+            try:
+                last_dig_idx = digi_idx
+            except:
+                last_dig_idx = -1
+            for i, (fov, zenith_ra, zenith_dec) in enumerate(zip(fovs, zenith.ra.deg, zenith.dec.deg)):
                 fov["pointings"].append(
                     {
                         "idx": last_dig_idx + 1 + i,
                         "center": {
                             "ra": {
-                                "value": zenith.ra.deg,
+                                "value": zenith_ra,
                                 "unit": "deg"
                             },
                             "dec": {
-                                "value": zenith.dec.deg,
+                                "value": zenith_dec,
                                 "unit": "deg"
                             },
                             "obs_direction_type": "zenith_xst"
@@ -1104,35 +1315,46 @@ class Parset(object):
         for i, fov in enumerate(data["field_of_views"]):
 
             # Check if remote MA are there
-            mas_in_fov = np.array([ma_in_fov["value"] for ma_in_fov in fov["mini_arrays"]])
-            if not np.any(mas_in_fov > 96):
+            remote_mas_in_fov_mask = fov["mini_arrays"] > 96
+            if not remote_mas_in_fov_mask.any():
                 continue
 
-            # Find out the receivers used
-            receivers_in_fov = []
-            for pointing in fov["pointings"]:
-                receivers_in_fov.append(pointing["receiver"]["name"])
-
             # Check if one of the associated pointings implies NICKEL
-            if "nickel" in receivers_in_fov:
+            if any(pointing.get("receiver", {}).get("name") == "nickel" for pointing in fov["pointings"]):
                 continue
 
             # Remove the remote Mini-Arrays
-            remote_mas_in_fov_mask = mas_in_fov > 96
-            fov["mini_arrays"] = np.array(fov["mini_arrays"])[~remote_mas_in_fov_mask].tolist()
+            fov["mini_arrays"] = fov["mini_arrays"][~remote_mas_in_fov_mask]
             log.info(
                 f"Remote Mini-Arrays have been removed for 'field_of_view' #{fov['idx']} because no associated 'pointing' is using the NICKEL receiver."
             )
 
+        # Convert the Mini-Arrays and antennas to their JSON form
+        for fov in data["field_of_views"]:
+            fov["mini_arrays"] = self._array_to_dict_array(fov["mini_arrays"].tolist())
+            fov["antennas"] = self._array_to_dict_array(fov["antennas"].tolist())
+
         data['parset_user'] = self.parset_user
 
         if path_name is not None:
             # Write the JSON file
             json_file_name = basename(self.parset).replace(".parset", ".json")
             json_file = join(path_name, json_file_name)
-            with open(json_file, 'w', encoding='utf-8') as wf:
-                json.dump(data, wf, ensure_ascii=False, indent=4)
-                log.info(f"'{json_file}' written.")
+            if orjson is not None:
+                option = orjson.OPT_SERIALIZE_NUMPY
+                if pretty:
+                    option |= orjson.OPT_INDENT_2
+                with open(json_file, 'wb') as wf:
+                    wf.write(orjson.dumps(data, option=option))
+            else:
+                # Non-ASCII characters are written as UTF-8, like orjson
+                if pretty:
+                    dump_kwargs = {"indent": 2, "ensure_ascii": False}
+                else:
+                    dump_kwargs = {"separators": (',', ':'), "ensure_ascii": False}
+                with open(json_file, 'w', encoding='utf-8') as wf:
+                    json.dump(data, wf, **dump_kwargs)
+            log.info(f"'{json_file}' written.")
         else:
             return data
 
@@ -1172,61 +1394,115 @@ class Parset(object):
 
     # --------------------------------------------------------- #
     # ----------------------- Internal ------------------------ #
+    def _json_file_name(self, path_name: str) -> str:
+        """ Returns the JSON file name associated with the parset. """
+        json_file_name = basename(self.parset).replace(".parset", ".json")
+        return join(path_name, json_file_name)
+
+
+    def _json_entry(self) -> _JsonEntry:
+        """ Builds the JSON representation of the parset. """
+
+        parset_version = self.version
+
+        json_entry = _JsonEntry(output=self.output)
+
+        json_entry.add_observation_metadata(
+            observation=self.observation,
+            parset_file=self.parset,
+            parset_user=self.parset_user
+        )
+
+        # Convert all the horizontal pointings to RA/Dec at once
+        beams = list(self.anabeams.values()) + list(self.digibeams.values())
+        if parset_version >= (1, 0):
+            beams += list(self.phase_centers.values())
+        radecs = iter(_get_pointing_centers(beams))
+
+        # Parse and store every field of view = analog configurations
+        for ana_idx, anabeam in self.anabeams.items():
+            json_entry.add_field_of_view(ana_idx, anabeam, radec=next(radecs))
+
+        # Parse and store every pointing = digital beam configurations
+        digi_idx = 0
+        for digi_idx, digibeam in self.digibeams.items():
+            json_entry.add_pointing(digi_idx, digibeam, parset_version, radec=next(radecs))
+
+        # Parse and store every imaging pointing = phase center configurations
+        if parset_version >= (1, 0):
+            # These were introduced with parset version 1.0
+            for center_idx, phase_center in self.phase_centers.items():
+                pc_index = center_idx + digi_idx + 1
+                json_entry.add_pointing(pc_index, phase_center, parset_version, radec=next(radecs))
+
+        # Add extra pointings in some specific cases
+        # If XST are used
+        if self.output.get("xst_userfile", False):
+            # Add a pointing per anabeam if XST data have been taken
+            json_entry.add_xst_pointings()
+        # If NICKEL is used, old parset versions
+        if parset_version < (1, 0):
+            if "nickel" in self.output.get("nri_receivers", []):
+                if "TBD" not in [beam["toDo"] for beam in self.digibeams.values()]:
+                    if len(self.anabeams) > 1:
+                        log.warning("Found more than 1 FoV. A NICKEL pointing is added for the first one ONLY.")
+
+                    # Add a NICKEL pointing corresponding to the analog beam
+                    index = len(json_entry.pointings)
+                    json_entry.add_nickel_pointing(anabeam=self.anabeams[0], index=index)
+
+        # Remove un-necessary Mini-Arrays indices
+        json_entry.remove_unused_miniarrays()
+
+        return json_entry
+
+
     def _decodeParset(self):
         """
         """
         
-        with open(self.parset, 'r') as file_object:
-            line = file_object.readline()
-            
-            while line:
-                try:
-                    dicoName, content = line.split('.', 1)
-                except ValueError:
-                    # This is a blank line
-                    pass
-                
-                key, value = content.split('=', 1)
-                
-                if line.startswith('Observation'):
-                    self.observation[key] = value
-                
-                elif line.startswith('Output'):
-                    self.output[key] = value
-                
-                elif line.startswith('AnaBeam'):
-                    anaIdx = int(re.search(r'\[(\d*)\]', dicoName).group(1))
-                    if anaIdx not in self.anabeams.keys():
-                        self.anabeams[anaIdx] = _ParsetProperty()
-                        self.anabeams[anaIdx]['anaIdx'] = str(anaIdx)
-                    self.anabeams[anaIdx][key] = value
-                
-                elif line.startswith('Beam'):
-                    digiIdx = int(re.search(r'\[(\d*)\]', dicoName).group(1))
-                    if digiIdx not in self.digibeams.keys():
-                        self.digibeams[digiIdx] = _ParsetProperty()
-                        self.digibeams[digiIdx]['digiIdx'] = str(digiIdx)
-                    self.digibeams[digiIdx][key] = value
-                
-                elif line.startswith('PhaseCenter'):
-                    pcIdx = int(re.search(r'\[(\d*)\]', dicoName).group(1))
-                    if pcIdx not in self.phase_centers.keys():
-                        self.phase_centers[pcIdx] = _ParsetProperty()
-                        self.phase_centers[pcIdx]['pcIdx'] = str(pcIdx)
-                    self.phase_centers[pcIdx][key] = value
-
-                line = file_object.readline()
-            
-            log.info(
-                f"Parset '{self._parset}' loaded."
-            )
+        # Read the whole file at once and split it afterwards
+        with open(self.parset, 'r', encoding='utf-8', errors='replace') as file_object:
+            parset_lines = file_object.read().splitlines()
+
+        def _beam_setter(beams: dict, index_key: str) -> Callable:
+            """ Returns a function filling out the ``beams`` properties. """
+            def _set(key, value, dicoName):
+                beamIdx = int(_IDX_RE.search(dicoName).group(1))
+                if beamIdx not in beams:
+                    beams[beamIdx] = _ParsetProperty()
+                    beams[beamIdx][index_key] = str(beamIdx)
+                beams[beamIdx][key] = value
+            return _set
+
+        # Dispatch the lines according to their prefix
+        setters = {
+            "Observation": lambda key, value, _: self.observation.__setitem__(key, value),
+            "Output": lambda key, value, _: self.output.__setitem__(key, value),
+            "AnaBeam": _beam_setter(self.anabeams, "anaIdx"),
+            "Beam": _beam_setter(self.digibeams, "digiIdx"),
+            "PhaseCenter": _beam_setter(self.phase_centers, "pcIdx")
+        }
+
+        for line in parset_lines:
+            if '.' not in line:
+                # This is a blank line
+                continue
+
+            dicoName, content = line.split('.', 1)
+            key, value = content.split('=', 1)
+
+            setter = setters.get(dicoName.split('[', 1)[0])
+            if setter is not None:
+                setter(key, value, dicoName)
+
+        log.info(
+            f"Parset '{self._parset}' loaded."
+        )
         
         try:
             with open(self.parset + '_user', 'r') as file_object:
-                line = file_object.readline()
-                while line:
-                    self.parset_user = self.parset_user + line
-                    line = file_object.readline()
+                self.parset_user += file_object.read()
         except Exception as e:
             pass
 
@@ -1239,31 +1515,8 @@ class Parset(object):
             entry.
             E.g. 'TF: DF=3.05 DT=10.0 HAMM'
         """
-        parameters = parameters.lower()
-        mode = parameters.split(':')[0]
-        if pulsar:
-            configs = {
-                param.split('=')[0]: param.split('=')[1]\
-                for param in parameters.split('--')\
-                if '=' in param
-            }
-            configs.update({
-                param.rstrip(): True\
-                for param in parameters.split('--')\
-                if '=' not in param
-            })
-        else:
-            configs = {
-                param.split('=')[0]: param.split('=')[1]\
-                for param in parameters.split()\
-                if '=' in param
-            }
-            configs.update({
-                param.rstrip(): True\
-                for param in parameters.split('--')\
-                if '=' not in param
-            })
-        return mode, configs
+        # Single pass parsing, shared with to_json
+        return _parse_parameters(parameters, pulsar=pulsar)
 
 
     @staticmethod
@@ -1300,7 +1553,7 @@ class Parset(object):
                   "lte": stop_time.isot
                },
             "duration": {
-                "value": np.round(duration.sec, 3),
+                "value": round(float(duration.sec), 3),
                 "unit": "s"
             }
         }
@@ -1309,12 +1562,12 @@ class Parset(object):
     @staticmethod
     def _get_frequency_dict(property, field="subbandList") -> dict:
         """ """
-        subband_list = property[field]
-        # Find consecutive subbands groups:
-        subband_list_groups = np.split(
-            subband_list,
-            np.where(np.diff(subband_list) != 1)[0] + 1
-        )
+        subband_list = np.asarray(property[field])
+        # Find consecutive subbands groups boundaries
+        starts, stops = _rle_boundaries(subband_list)
+        # Convert all the groups edges at once
+        freq_min = sb2freq(subband_list[starts]).to_value(u.MHz)
+        freq_max = (sb2freq(subband_list[stops - 1]) + SB_WIDTH).to_value(u.MHz)
         # return {
         #     "value": [
         #         {
@@ -1327,28 +1580,28 @@ class Parset(object):
         return [
             {
                 "value": {
-                    "gte": sb2freq(group.min())[0].to(u.MHz).value,
-                    "lt": (sb2freq(group.max()) + SB_WIDTH)[0].to(u.MHz).value,
+                    "gte": gte,
+                    "lt": lt,
                 },
                 "unit": "MHz"
-            } for group in subband_list_groups
+            } for gte, lt in zip(freq_min, freq_max)
         ]
 
 
     @staticmethod
     def _get_miniarray_dict(mini_arrays: np.ndarray) -> dict:
         """ """
-        # Find consecutive Mini-Arrays groups
-        ma_groups = np.split(
-            mini_arrays,
-            np.where(np.diff(mini_arrays) != 1)[0] + 1
-        )
+        mini_arrays = np.asarray(mini_arrays)
+        # Find consecutive Mini-Arrays groups boundaries
+        starts, stops = _rle_boundaries(mini_arrays)
+        firsts = mini_arrays[starts].tolist()
+        lasts = mini_arrays[stops - 1].tolist()
         return {
             "value": [
                 {
-                    "gte": group[0],
-                    "lte": group[-1] 
-                } for group in ma_groups
+                    "gte": first,
+                    "lte": last
+                } for first, last in zip(firsts, lasts)
             ],
             "unit": ""
         }
@@ -1364,18 +1617,18 @@ class Parset(object):
                 valmax: u.Quantity = 90*u.deg
             ):
             """ Constrain an angle between two values. """
-            if angle < valmin:
-                angle = valmin 
-            elif angle > valmax:
-                angle = valmax
-            else:
-                pass
-            return angle
+            return max(valmin, min(angle, valmax))
 
         # Sort out the beam start and stop times
         duration = TimeDelta(property['duration'] , format='sec')
         start_time = property['startTime']
         stop_time = (property['startTime'] + duration)
+        mid_time = start_time + duration/2.
+        # Same horizontal frame for every conversion
+        altaz_frame = AltAz(
+            obstime=mid_time,
+            location=nenufar_position
+        )
 
         if "azelFile" in property:
             # In case of pointing described by an azelfile
@@ -1388,12 +1641,7 @@ class Parset(object):
             ra = property['angle1'].to(u.deg)
             dec = property['angle2'].to(u.deg)
             if ("decal_az" in property) or ("decal_el" in property):
-                altaz = SkyCoord(ra, dec).transform_to(
-                    AltAz(
-                        obstime=start_time + duration/2.,
-                        location=nenufar_position
-                    )
-                )
+                altaz = SkyCoord(ra, dec).transform_to(altaz_frame)
                 radec = SkyCoord(
                     _constrain_angle(
                         altaz.az + float(property.get("decal_az", 0.0))*u.deg,
@@ -1405,10 +1653,7 @@ class Parset(object):
                         valmin=0.*u.deg,
                         valmax=90.*u.deg
                     ),
-                    frame=AltAz(
-                        obstime=start_time + duration/2.,
-                        location=nenufar_position
-                    )
+                    frame=altaz_frame
                 ).transform_to(ICRS)
                 ra = radec.ra
                 dec = radec.dec
@@ -1440,10 +1685,7 @@ class Parset(object):
                     valmin=0.*u.deg,
                     valmax=90.*u.deg
                 ),
-                frame=AltAz(
-                    obstime=start_time + duration/2.,
-                    location=nenufar_position
-                )
+                frame=altaz_frame
             ).transform_to(ICRS)
             right_ascension = _constrain_angle(
                 radec.ra.deg + float(property.get("decal_ra", 0.0)),
@@ -1461,10 +1703,7 @@ class Parset(object):
             radec = SkyCoord(
                 0.*u.deg,
                 90*u.deg,
-                frame=AltAz(
-                    obstime=start_time + duration/2.,
-                    location=nenufar_position
-                )
+                frame=altaz_frame
             ).transform_to(ICRS)
             right_ascension = radec.ra.deg
             declination = radec.dec.deg
@@ -1476,9 +1715,11 @@ class Parset(object):
 
         else:
             # Dealing with a Solar System source
-            solar_system_target = SolarSystemTarget.from_name(
+            solar_system_target = _solar_system_target(
                 name=direction_type,
-                time=start_time + duration/2.
+                jd1=mid_time.jd1,
+                jd2=mid_time.jd2,
+                scale=mid_time.scale
             )
             radec = solar_system_target.coordinates
             if ("decal_az" in property) or ("decal_el" in property):
@@ -1494,10 +1735,7 @@ class Parset(object):
                         valmin=0.*u.deg,
                         valmax=90.*u.deg
                     ),
-                    frame=AltAz(
-                        obstime=start_time + duration/2.,
-                        location=nenufar_position
-                    )
+                    frame=altaz_frame
                 ).transform_to(ICRS)
             decal_ra = float(property.get("decal_ra", 0.0))*u.deg
             decal_dec = float(property.get("decal_dec", 0.0))*u.deg
@@ -1526,16 +1764,128 @@ class Parset(object):
 # ============================================================= #
 
 
+def _convert_one(parset_path: str, out_dir: str) -> str:
+    """ Converts ``parset_path`` to a JSON file in ``out_dir``
+        and returns its name (module-level to be pickleable).
+    """
+    parset = Parset(parset_path)
+    parset.to_json(path_name=out_dir)
+    return parset._json_file_name(out_dir)
+
+
+def convert_many(parset_paths: list, out_dir: str, workers: int = None) -> list:
+    """ Converts several parset files to JSON files written in
+        the ``out_dir`` directory. Each parset is independently
+        decoded and converted by a pool of processes, the
+        coordinate computations being CPU-bound.
+
+        :param parset_paths:
+            Parset files to convert.
+        :type parset_paths:
+            `list` of `str`
+        :param out_dir:
+            Directory where the JSON files are written.
+        :type out_dir:
+            `str`
+        :param workers:
+            Maximum number of processes (see :class:`~concurrent.futures.ProcessPoolExecutor`).
+        :type workers:
+            `int`
+
+        :returns:
+            The written JSON file names, in the order of ``parset_paths``.
+        :rtype:
+            `list` of `str`
+
+        .. seealso::
+            :meth:`~nenupy.observation.parset.Parset.to_json_batch`, which
+            only overlaps the file writing with the parsing (threads, no
+            process start-up cost) and suits small batches.
+    """
+    json_files = [None] * len(parset_paths)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_convert_one, parset_path, out_dir): i\
+            for i, parset_path in enumerate(parset_paths)
+        }
+        for future in as_completed(futures):
+            # Raises the conversion errors, if any
+            json_files[futures[future]] = future.result()
+    log.info(f"{len(json_files)} parset files converted to JSON in '{out_dir}'.")
+    return json_files
+# ============================================================= #
+
+
 # ============================================================= #
 # ------------------------ ParsetUser ------------------------- #
 # ============================================================= #
+@lru_cache(maxsize=None)
+def _compiled_syntax(syntax: str) -> re.Pattern:
+    """ Compiles a configuration syntax regex once. """
+    return re.compile(syntax)
+
+
+@lru_cache(maxsize=4096)
+def _syntax_match(pattern: re.Pattern, value: str) -> bool:
+    """ Checks that ``value`` fully matches ``pattern``. The
+        result is shared by every key using the same syntax
+        and value (e.g. the start times of several beams).
+    """
+    return pattern.fullmatch(value) is not None
+
+
+class _CfgEntry:
+    """ Configuration entry of a parset block (see
+        :data:`~nenupy.observation.PARSET_OPTIONS`).
+    """
+
+    __slots__ = ("value", "required", "modified", "syntax", "pattern")
+
+    def __init__(self, value, required, modified=False, syntax=None):
+        self.value = value
+        self.required = required
+        self.modified = modified
+        self.syntax = syntax
+        self.pattern = None if syntax is None else _compiled_syntax(syntax)
+
+
+    def __repr__(self) -> str:
+        return f"<_CfgEntry(value={self.value!r}, required={self.required}, modified={self.modified})>"
+
+# Global source of the _ParsetBlock versions
+_BLOCK_VERSIONS = itertools.count(1)
+
+# Keys carrying a syntax to validate, for each field
+_SYNTAX_KEYS = {
+    field: frozenset(key for key, option in options.items() if "syntax" in option)
+    for field, options in PARSET_OPTIONS.items()
+}
+
+# ============================================================= #
+
 class _ParsetBlock:
     """
     """
 
     def __init__(self, field):
         self.field = field
-        self.configuration = deepcopy(PARSET_OPTIONS[self.field])
+        # New entries, the options only hold str/bool leaves
+        self.configuration = {
+            key: _CfgEntry(**option) for key, option in PARSET_OPTIONS[self.field].items()
+        }
+        # Keys that have a syntax to check (shared by all blocks of a field)
+        self._syntax_keys = _SYNTAX_KEYS[self.field]
+        # Entries with a syntax modified since the last successful
+        # validation (ordered by key)
+        self._dirty_keys = {}
+        # Version renewed at each modification, used to invalidate the
+        # cached written block and the validation signature. Versions
+        # are drawn from a global counter so that two distinct block
+        # states never share the same version.
+        self._version = next(_BLOCK_VERSIONS)
+        self._str_cache = None
+        self._cache_version = None
+        self._cache_index = None
     
 
     def __setitem__(self, key, value):
@@ -1547,7 +1897,7 @@ class _ParsetBlock:
     def __getitem__(self, key):
         """
         """
-        return self.configuration[key]["value"]
+        return self.configuration[key].value
 
 
     @property
@@ -1578,8 +1928,12 @@ class _ParsetBlock:
                     value = "true" if value else "false"
 
                 # Updates the key value
-                self.configuration[key]["value"] = value
-                self.configuration[key]["modified"] = True
+                entry = self.configuration[key]
+                entry.value = value
+                entry.modified = True
+                if key in self._syntax_keys:
+                    self._dirty_keys[key] = entry
+                self._version = next(_BLOCK_VERSIONS)
             
             # If the key doesn't exist a warning message is raised
             else:
@@ -1591,18 +1945,25 @@ class _ParsetBlock:
     def _write_block_list(self, index=None) -> str:
         """
         """
+        # Nothing changed since the last call
+        if (self._cache_version == self._version) and (self._cache_index == index):
+            return self._str_cache
+
         # Prints a counter that is shown regarding the beam indices
         if index is not None:
-            counter = f"[{index}]"
+            prefix = f"{self.field}[{index}]."
         else:
-            counter = ""
+            prefix = f"{self.field}."
 
         # Writes the parset blocks in the correct format
-        return "\n".join(
-            [f"{self.field}{counter}.{key}={val['value']}"
-                for key, val in self.configuration.items()
-                if (val['modified'] or val['required'])
-            ])
+        self._str_cache = "\n".join(
+            prefix + key + "=" + str(entry.value)
+            for key, entry in self.configuration.items()
+            if (entry.modified or entry.required)
+        )
+        self._cache_index = index
+        self._cache_version = self._version
+        return self._str_cache
 
 # ============================================================= #
 
@@ -1631,10 +1992,7 @@ class _BeamParsetBlock(_ParsetBlock):
         """ Reads the 'duration' field and converts it to a TimeDelta instance. """
 
         # Regex check to split the value and the unit
-        match = re.match(
-            pattern=r"(?P<value>\d+)(?P<unit>[smh])",
-            string=self["duration"]
-        )
+        match = _DUR_RE.match(self["duration"])
         value = float(match.group("value"))
 
         # Prepares a dictionnary to convert unit to seconds
@@ -1710,13 +2068,6 @@ class _AnalogBeamParsetBlock(_BeamParsetBlock):
             )
         )
 
-
-    def _propagate_index(self) -> None:
-        """
-        """
-        for i, numbeam in enumerate(self.numerical_beams):
-            numbeam["noBeam"] = self.index
-
 # ============================================================= #
 
 class _OutputParsetBlock(_ParsetBlock):
@@ -1812,21 +2163,45 @@ class ParsetUser:
         self.observation = _ObservationParsetBlock()
         self.output = _OutputParsetBlock()
         self.analog_beams = []
+        # (analog beam index, local index) of each numerical beam
+        self._numbeam_owner = []
+        self._flat_numbeams = []
+        # Beam counts, updated by _reindex_all
+        self._n_ana = 0
+        self._n_num = 0
+        self._n_pc = 0
+        # Shape of the beam lists when they were last indexed
+        self._indexed_shape = ()
+        # Blocks signature of the last successful validation
+        self._last_validated_signature = None
 
 
     def __str__(self):
+        text = io.StringIO()
+        self._write_to(text)
+        return text.getvalue()
+
+
+    def _write_to(self, wfile) -> None:
+        """ Writes the text blocks one after the other in ``wfile``
+            (any object with a ``write`` method), without building
+            the whole *parset_user* string.
+        """
         self._update_beam_numbers()
 
-        # Prepares the different text blocks
-        observation_text = str(self.observation)
-        output_text = str(self.output)
-        return "\n\n".join(
-            [observation_text,
-            self._analog_beams_str,
-            self._numerical_beams_str,
-            self._phase_center_str,
-            output_text]
-        )
+        wfile.write(str(self.observation))
+        for beams in (
+                self.analog_beams,
+                self.flat_numbeams,
+                [pc for anabeam in self.analog_beams for pc in anabeam.phase_centers]
+            ):
+            wfile.write("\n\n")
+            for i, beam in enumerate(beams):
+                if i > 0:
+                    wfile.write("\n\n")
+                wfile.write(str(beam))
+        wfile.write("\n\n")
+        wfile.write(str(self.output))
 
 
     @property
@@ -1860,37 +2235,14 @@ class ParsetUser:
 
 
     @property
-    def _analog_beams_str(self) -> str:
+    def flat_numbeams(self) -> list:
+        """ All the *numerical beams*, ordered by index
+            (rebuilt only when the beams are added or removed).
         """
-        """
-        return "\n\n".join(
-            str(anabeam)
-            for anabeam in self.analog_beams
-        )
+        self._reindex_if_needed()
+        return self._flat_numbeams
 
 
-    @property
-    def _numerical_beams_str(self) -> str:
-        """
-        """
-        return "\n\n".join(
-            str(numbeam)
-            for anabeam in self.analog_beams
-            for numbeam in anabeam.numerical_beams
-        )
-
-
-    @property
-    def _phase_center_str(self) -> str:
-        """
-        """
-        return "\n\n".join(
-            str(pc)
-            for anabeam in self.analog_beams
-            for pc in anabeam.phase_centers
-        )
-
-    
     def set_observation_config(self, **kwargs) -> None:
         """ Sets the configuration of the *parset_user* observation block.
             This method ingests any valid `keyword argument <https://doc-nenufar.obs-nancay.fr/UsersGuide/parsetFileuserparset_user.html>`_ corresponding to an *Observation* configuration.
@@ -1959,7 +2311,7 @@ class ParsetUser:
         self.analog_beams.append(
             _AnalogBeamParsetBlock(**kwargs)
         )
-        self._updates_anabeams_indices()
+        self._reindex_all()
 
 
     def modify_analog_beam(self, anabeam_index: int, **kwargs) -> None:
@@ -2019,7 +2371,7 @@ class ParsetUser:
 
         """
         del self.analog_beams[anabeam_index]
-        self._updates_anabeams_indices()
+        self._reindex_all()
 
 
     def add_numerical_beam(self, anabeam_index: int = 0, **kwargs) -> None:
@@ -2054,8 +2406,7 @@ class ParsetUser:
             )
         anabeam = self.analog_beams[anabeam_index]
         anabeam._add_numerical_beam(**kwargs)
-        anabeam._propagate_index()
-        self._updates_numbeams_indices()
+        self._reindex_all()
         
 
     def modify_numerical_beam(self, numbeam_index: int, **kwargs) -> None:
@@ -2078,25 +2429,24 @@ class ParsetUser:
                     p.modify_numerical_beam(0, target="Modified_Value")
 
         """
-        counter = 0
-        for anabeam in self.analog_beams:
-            for i, _ in enumerate(anabeam.numerical_beams):
-                if counter==numbeam_index:
-                    anabeam.numerical_beams[i]._modify_properties(**kwargs)
-                    break
-                counter += 1
-            else:
-                continue
-            break
+        if 0 <= numbeam_index < len(self.flat_numbeams):
+            self.flat_numbeams[numbeam_index]._modify_properties(**kwargs)
 
 
-    def remove_numerical_beam(self, numbeam_index: int) -> None:
+    def remove_numerical_beam(self, numbeam_index: int, keep_order: bool = True) -> None:
         """ Removes a *numerical beam* and updates the *numerical beam* indices.
 
             :param numbeam_index:
                 Index of the *numerical beam* to remove.
             :type numbeam_index:
                 `int`
+            :param keep_order:
+                If ``False``, the removed *numerical beam* is replaced by
+                the last *numerical beam* of the same *analog beam* (faster
+                removal), which then takes its index. Otherwise, the
+                following *numerical beams* are shifted. Default is ``True``.
+            :type keep_order:
+                `bool`
             
             .. note::
                 One can quickly identify the indices of the numerical beams:
@@ -2128,17 +2478,17 @@ class ParsetUser:
                     p.remove_numerical_beam(numbeam_index=0) # removes the numerical beam "One"
 
         """
-        counter = 0
-        for anabeam in self.analog_beams:
-            for i, _ in enumerate(anabeam.numerical_beams):
-                if counter==numbeam_index:
-                    del anabeam.numerical_beams[i]
-                    break
-                counter += 1
+        self._reindex_if_needed()
+        if 0 <= numbeam_index < len(self._numbeam_owner):
+            ab_idx, local_idx = self._numbeam_owner[numbeam_index]
+            numbeams = self.analog_beams[ab_idx].numerical_beams
+            if keep_order:
+                del numbeams[local_idx]
             else:
-                continue
-            break
-        self._updates_numbeams_indices()
+                # Swap with the last one to avoid shifting the list
+                numbeams[local_idx] = numbeams[-1]
+                numbeams.pop()
+        self._reindex_all()
 
 
     def add_phase_center(self, anabeam_index: int = 0, **kwargs) -> None:
@@ -2173,8 +2523,7 @@ class ParsetUser:
             )
         anabeam = self.analog_beams[anabeam_index]
         anabeam._add_phase_center(**kwargs)
-        anabeam._propagate_index()
-        self._updates_phasecenter_indices()
+        self._reindex_all()
 
 
     def modify_phase_center(self, phasecenter_index: int, **kwargs) -> None:
@@ -2257,7 +2606,7 @@ class ParsetUser:
             else:
                 continue
             break
-        self._updates_phasecenter_indices()
+        self._reindex_all()
 
 
     def validate(self) -> bool:
@@ -2272,72 +2621,98 @@ class ParsetUser:
                 This is merely just a syntax validation made with regular expressions.
                 The relevance of the parameter values are not checked at all.
 
+            .. note::
+                Only the keys modified since the last successful validation
+                (and having a syntax to check) are validated. Calling this
+                method again without any modification of the *parset_user*
+                returns immediately.
+
         """
         is_valid = True
 
         # Update the beam numbers on the Observation table
         self._update_beam_numbers()
 
+        # Nothing changed since the last successful validation
+        signature = self._blocks_signature()
+        if signature == self._last_validated_signature:
+            log.info("Configuration unchanged since the last successful validation.")
+            return True
+
         # Check that the beams are above the horizon during the course of the observation
+        below_horizon = {"Analog beams": [], "Numerical beams": [], "Phase centers": []}
         for anabeam in self.analog_beams:
             if not anabeam.is_above_horizon():
-                log.warning("")
+                below_horizon["Analog beams"].append(anabeam.index)
             for numbeam in anabeam.numerical_beams:
                 if not numbeam.is_above_horizon():
-                    log.warning("")
+                    below_horizon["Numerical beams"].append(numbeam.index)
             for pc in anabeam.phase_centers:
                 if not pc.is_above_horizon():
-                    log.warning("")
+                    below_horizon["Phase centers"].append(pc.index)
+        for beam_type, indices in below_horizon.items():
+            if indices:
+                log.warning("%s below the horizon: %s.", beam_type, indices)
 
-        def check_keys(dictionnary: dict) -> bool:
+        def check_keys(block: _ParsetBlock) -> bool:
             all_keys_ok = True
 
-            # Check each key and the corresponding regex syntax
-            for key in dictionnary:
-                # Get the regex syntax and if it doesn't exist, go to the next key
-                try:
-                    syntax_pattern = dictionnary[key]['syntax']
-                except KeyError:
-                    continue
+            # Check each key (with a syntax) modified since the last successful validation
+            for key, entry in block._dirty_keys.items():
+                syntax_pattern = entry.pattern
 
-                # Don't check the key if it has not been modified
-                if not dictionnary[key]["modified"]:
-                    continue
-
-                # Retrieve the value that needs to be checked
-                value = dictionnary[key]["value"]
-                if str(value) == '':
-                    log.warning(f"Empty value for key '{key}'.")
+                # Retrieve the value that needs to be checked (converted once)
+                value = entry.value
+                str_value = value if type(value) is str else str(value)
+                if not str_value:
+                    log.warning("Empty value for key '%s'.", key)
 
                 # Perform a regex full match check, send a warning if invalid
-                if re.fullmatch(pattern=syntax_pattern, string=str(value)) is None:
+                if not _syntax_match(syntax_pattern, str_value):
                     log.error(
-                        f"Syntax error on '{value}' (key '{key}'). Please check https://doc-nenufar.obs-nancay.fr/UsersGuide/parsetFileuserparset_user.html"
+                        "Syntax error on '%s' (key '%s'). Please check https://doc-nenufar.obs-nancay.fr/UsersGuide/parsetFileuserparset_user.html",
+                        value, key
                     )
                     all_keys_ok &= False
 
+            # Valid keys don't need to be checked again until modified
+            if all_keys_ok:
+                block._dirty_keys.clear()
+
             return all_keys_ok 
 
         # Check all configurations
-        log.info("Checking 'observation' block...")
-        is_valid &= check_keys(self.observation.configuration)
+        for block_name, block in self._iter_blocks():
+            log.info("Checking '%s' block...", block_name)
+            is_valid &= check_keys(block)
 
-        log.info("Checking 'output' block...")
-        is_valid &= check_keys(self.output.configuration)
+        # Failed validations are never cached
+        if is_valid:
+            self._last_validated_signature = signature
 
-        for anabeam in self.analog_beams:
-            log.info(f"Checking 'anabeam[{anabeam.index}]' block...")
-            is_valid &= check_keys(anabeam.configuration)
+        return is_valid
 
-            for numbeam in anabeam.numerical_beams:
-                log.info(f"Checking 'beam[{numbeam.index}]' block...")
-                is_valid &= check_keys(numbeam.configuration)
-            
-            for pc in anabeam.phase_centers:
-                log.info(f"Checking 'phasecenter[{pc.index}]' block...")
-                is_valid &= check_keys(pc.configuration)
 
-        return is_valid
+    @classmethod
+    def validate_batch(cls, parsets) -> list:
+        """ Validates the syntax of several *parset_user*, this is
+            a convenience loop over
+            :meth:`~nenupy.observation.parset.ParsetUser.validate`
+            (the syntax check results are already cached across
+            instances).
+
+            :param parsets:
+                Instances of :class:`~nenupy.observation.parset.ParsetUser`
+                to validate.
+            :type parsets:
+                iterable of :class:`~nenupy.observation.parset.ParsetUser`
+
+            :returns:
+                Validity of each *parset_user*.
+            :rtype:
+                `list` of `bool`
+        """
+        return [parset.validate() for parset in parsets]
 
 
     def write(self, file_name: str) -> None:
@@ -2352,46 +2727,99 @@ class ParsetUser:
         """
         if not file_name.endswith(".parset_user"):
             raise ValueError(f"file_name='{file_name}' does not end with '.parset_user'.")
-        with open(file_name, "w") as wfile:
-            wfile.write(str(self))
+        with open(file_name, "w", buffering=1<<20) as wfile:
+            self._write_to(wfile)
         log.debug(f"Parset written in file {file_name}.")
 
 
-    def _updates_numbeams_indices(self) -> None:
-        """ Updates the indices of numerical beams. """
-        numbeams_counter = 0
+    def _iter_blocks(self):
+        """ Yields every (name, block) of the *parset_user*, each
+            analog beam being followed by its numerical beams and
+            phase centers.
+        """
+        yield "observation", self.observation
+        yield "output", self.output
         for anabeam in self.analog_beams:
+            yield f"anabeam[{anabeam.index}]", anabeam
             for numbeam in anabeam.numerical_beams:
-                numbeam.index = numbeams_counter
-                numbeams_counter += 1
+                yield f"beam[{numbeam.index}]", numbeam
+            for pc in anabeam.phase_centers:
+                yield f"phasecenter[{pc.index}]", pc
 
 
-    def _updates_phasecenter_indices(self) -> None:
-        """ Updates the indices of phase centers. """
+    def _blocks_signature(self) -> tuple:
+        """ Returns the versions of every block, in writing order.
+            Any key modification or any beam addition/removal
+            results in a different signature.
+        """
+        return tuple(block._version for _, block in self._iter_blocks())
+
+
+    def _reindex_all(self) -> None:
+        """ Updates the indices of analog beams, numerical beams
+            and phase centers in a single traversal, propagating
+            the analog beam index to its numerical beams.
+        """
+        numbeams_counter = 0
         pc_counter = 0
-        for anabeam in self.analog_beams:
+        self._numbeam_owner = []
+        self._flat_numbeams = []
+        for ab_idx, anabeam in enumerate(self.analog_beams):
+            anabeam.index = ab_idx
+            for local_idx, numbeam in enumerate(anabeam.numerical_beams):
+                # Only rewritten if the analog beam index changed
+                no_beam = numbeam.configuration["noBeam"]
+                if not (no_beam.modified and no_beam.value == ab_idx):
+                    numbeam["noBeam"] = ab_idx
+                numbeam.index = numbeams_counter
+                self._numbeam_owner.append((ab_idx, local_idx))
+                self._flat_numbeams.append(numbeam)
+                numbeams_counter += 1
             for pc in anabeam.phase_centers:
                 pc.index = pc_counter
                 pc_counter += 1
+        self._n_ana = len(self.analog_beams)
+        self._n_num = numbeams_counter
+        self._n_pc = pc_counter
+        self._indexed_shape = self._beams_shape()
+
+    # Kept for backward compatibility, every index is updated at once
+    _updates_numbeams_indices = _reindex_all
+    _updates_phasecenter_indices = _reindex_all
+    _updates_anabeams_indices = _reindex_all
+
+
+    def _beams_shape(self) -> tuple:
+        """ Returns the analog beams and the number of numerical
+            beams and phase centers they hold. The analog beams are
+            identified by their version, drawn from a global counter
+            and never reused (unlike ``id()``).
+        """
+        return tuple(
+            (anabeam._version, len(anabeam.numerical_beams), len(anabeam.phase_centers))
+            for anabeam in self.analog_beams
+        )
 
 
-    def _updates_anabeams_indices(self) -> None:
-        """ Updates the indices of analog beams. """
-        anabeams_counter = 0
-        for anabeam in self.analog_beams:
-            anabeam.index = anabeams_counter
-            anabeam._propagate_index()
-            anabeams_counter += 1
-        self._updates_numbeams_indices()
+    def _reindex_if_needed(self) -> None:
+        """ Re-indexes the beams if the (public) beam lists have
+            been modified without the add/remove methods.
+        """
+        if self._beams_shape() != self._indexed_shape:
+            self._reindex_all()
 
 
     def _update_beam_numbers(self) -> None:
         """ Updates the number of analog, numerical beams and phase centers. """
-        nb_analog_beams = len(self.analog_beams)
-        nb_numerical_beams = sum(len(anabeam.numerical_beams) for anabeam in self.analog_beams)
-        nb_phase_centers = sum(len(anabeam.phase_centers) for anabeam in self.analog_beams)
-        self.observation["nrAnabeams"] = str(nb_analog_beams)
-        self.observation["nrBeams"] = str(nb_numerical_beams)
-        self.observation["nrPhaseCenters"] = str(nb_phase_centers)
+        self._reindex_if_needed()
+        for key, count in (
+                ("nrAnabeams", self._n_ana),
+                ("nrBeams", self._n_num),
+                ("nrPhaseCenters", self._n_pc)
+            ):
+            # Only modify the Observation block if needed
+            entry = self.observation.configuration[key]
+            if (not entry.modified) or (entry.value != str(count)):
+                self.observation[key] = str(count)
 # ============================================================= #
 # ============================================================= #
@@ -25,7 +25,8 @@ setup(
     ],
     extras_require={
         #'astroplan': 'astroplan',
-        'mocpy': 'mocpy'
+        'mocpy': 'mocpy',
+        'orjson': 'orjson'
     },
     python_requires='>=3.6',
     scripts=[
@@ -0,0 +1,415 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+
+__author__ = 'Alan Loh'
+__copyright__ = 'Copyright 2022, nenupy'
+__credits__ = ['Alan Loh']
+__maintainer__ = 'Alan'
+__email__ = 'alan.loh@obspm.fr'
+__status__ = 'Production'
+
+
+from os.path import join, dirname, basename
+import copy
+import json
+import pickle
+import pytest
+
+from nenupy.observation import Parset, ParsetUser, convert_many
+from nenupy.observation import parset as parset_module
+from nenupy.observation.parset import _ParsetProperty, _AnalogBeamParsetBlock, _parse_parameters
+
+
+PARSET_FILE = join(dirname(__file__), 'test_data/2022_version1.parset')
+PARSET_FILES = [
+    PARSET_FILE,
+    join(dirname(__file__), 'test_data/vira_tracking_nickel.parset'),
+    join(dirname(__file__), 'test_data/zenith_tracking_tf.parset')
+]
+
+
+def _read_files(file_names):
+    contents = []
+    for file_name in file_names:
+        with open(file_name, 'rb') as rf:
+            contents.append(rf.read())
+    return contents
+
+
+def _single_json_files(directory):
+    json_files = []
+    for parset_file in PARSET_FILES:
+        parset = Parset(parset_file)
+        parset.to_json(path_name=str(directory))
+        json_files.append(parset._json_file_name(str(directory)))
+    return json_files
+
+
+# ============================================================= #
+# ------------------- test_parset_roundtrip ------------------- #
+# ============================================================= #
+@pytest.mark.parametrize(
+    "roundtrip",
+    [copy.deepcopy, lambda obj: pickle.loads(pickle.dumps(obj))]
+)
+def test_parset_roundtrip(roundtrip):
+    prop = _ParsetProperty({"startTime": "2022-01-01T00:00:00Z", "subbandList": "[10..12]"})
+    prop_copy = roundtrip(prop)
+    assert isinstance(prop_copy, _ParsetProperty)
+    assert prop_copy == prop
+    assert prop_copy["subbandList"] == [10, 11, 12]
+    assert prop_copy._freq_cache == prop._freq_cache
+
+    parset = Parset(PARSET_FILE)
+    json_data = parset.to_json()
+    parset_copy = roundtrip(parset)
+    assert parset_copy.observation == parset.observation
+    assert parset_copy.digibeams == parset.digibeams
+    assert parset_copy.to_json() == json_data
+# ============================================================= #
+
+
+
+
+# ============================================================= #
+# ---------------- test_parsetuser_beam_indices --------------- #
+# ============================================================= #
+def _beam_indices(parset):
+    return [
+        (numbeam.index, numbeam["noBeam"])
+        for anabeam in parset.analog_beams
+        for numbeam in anabeam.numerical_beams
+    ]
+
+
+def test_parsetuser_beam_indices():
+    parset = ParsetUser()
+    parset.add_analog_beam(target="CygA")
+    parset.add_analog_beam(target="CasA")
+    parset.add_numerical_beam(anabeam_index=0, target="CygA")
+    parset.add_numerical_beam(anabeam_index=1, target="CasA")
+    parset.add_numerical_beam(anabeam_index=0, target="CygA")
+
+    # Indices set while adding beams match a full re-indexing
+    indices = _beam_indices(parset)
+    assert indices == [(0, 0), (1, 0), (2, 1)]
+    parset._reindex_all()
+    assert _beam_indices(parset) == indices
+
+    # Removing an analog beam shifts the analog beam index
+    parset.remove_analog_beam(0)
+    assert _beam_indices(parset) == [(0, 0)]
+# ============================================================= #
+
+
+
+# ============================================================= #
+# ----------------- test_parsetuser_direct_edit --------------- #
+# ============================================================= #
+def test_parsetuser_direct_edit():
+    parset = ParsetUser()
+    parset.add_analog_beam(target="CygA")
+    # Beam lists modified without the add/remove methods
+    parset.analog_beams.append(_AnalogBeamParsetBlock(target="CasA"))
+    parset.analog_beams[1]._add_numerical_beam(target="CasA")
+
+    lines = str(parset).splitlines()
+    assert "Observation.nrAnabeams=2" in lines
+    assert "Observation.nrBeams=1" in lines
+    assert "Anabeam[1].target=CasA" in lines
+    assert "Beam[0].target=CasA" in lines
+    assert "Beam[0].noBeam=1" in lines
+
+    parset.analog_beams[0]._add_numerical_beam(target="CygA")
+    assert [numbeam["target"] for numbeam in parset.flat_numbeams] == ["CygA", "CasA"]
+    parset.modify_numerical_beam(1, target="VirA")
+    assert parset.analog_beams[1].numerical_beams[0]["target"] == "VirA"
+    parset.remove_numerical_beam(0)
+    assert parset.analog_beams[0].numerical_beams == []
+    assert _beam_indices(parset) == [(0, 1)]
+# ============================================================= #
+
+
+# ============================================================= #
+# -------------- test_parsetuser_validate_batch --------------- #
+# ============================================================= #
+def test_parsetuser_validate_batch():
+    parsets = []
+    for target in ["CygA", "Cyg A", "CasA"]:
+        parset = ParsetUser()
+        parset.add_analog_beam(target=target)
+        parsets.append(parset)
+    assert ParsetUser.validate_batch(parsets) == [True, False, True]
+    assert ParsetUser.validate_batch(parsets) == [parset.validate() for parset in parsets]
+    assert ParsetUser.validate_batch([]) == []
+# ============================================================= #
+
+
+# ============================================================= #
+# ------------------ test_parset_to_json_batch ---------------- #
+# ============================================================= #
+def test_parset_to_json_batch(tmp_path):
+    single_dir = tmp_path / "single"
+    batch_dir = tmp_path / "batch"
+    single_dir.mkdir()
+    batch_dir.mkdir()
+    single_files = _single_json_files(single_dir)
+    batch_files = Parset.to_json_batch(PARSET_FILES, str(batch_dir), max_workers=2)
+    assert [basename(f) for f in batch_files] == [basename(f) for f in single_files]
+    assert _read_files(batch_files) == _read_files(single_files)
+# ============================================================= #
+
+
+# ============================================================= #
+# --------------------- test_convert_many --------------------- #
+# ============================================================= #
+def test_convert_many(tmp_path):
+    single_dir = tmp_path / "single"
+    many_dir = tmp_path / "many"
+    single_dir.mkdir()
+    many_dir.mkdir()
+    single_files = _single_json_files(single_dir)
+    many_files = convert_many(PARSET_FILES, str(many_dir), workers=2)
+    assert [basename(f) for f in many_files] == [basename(f) for f in single_files]
+    assert _read_files(many_files) == _read_files(single_files)
+    assert convert_many([], str(many_dir)) == []
+# ============================================================= #
+
+
+# ============================================================= #
+# ----------------- test_parset_to_json_old_pretty ------------ #
+# ============================================================= #
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_parset_to_json_old_pretty(tmp_path, monkeypatch, use_orjson):
+    if not use_orjson:
+        # Standard json fallback
+        monkeypatch.setattr(parset_module, "orjson", None)
+    parset = Parset(PARSET_FILE)
+    json_name = basename(PARSET_FILE).replace(".parset", ".json")
+    compact_dir = tmp_path / "compact"
+    pretty_dir = tmp_path / "pretty"
+    compact_dir.mkdir()
+    pretty_dir.mkdir()
+    parset.to_json_old(path_name=str(compact_dir))
+    parset.to_json_old(path_name=str(pretty_dir), pretty=True)
+    compact, pretty = _read_files([
+        join(str(compact_dir), json_name),
+        join(str(pretty_dir), json_name)
+    ])
+    assert b"\n" not in compact
+    assert b'\n  "' in pretty
+    assert json.loads(compact) == json.loads(pretty)
+# ============================================================= #
+
+
+# ============================================================= #
+# ---------------- test_parset_to_json_old_utf8 --------------- #
+# ============================================================= #
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_parset_to_json_old_utf8(tmp_path, monkeypatch, use_orjson):
+    if not use_orjson:
+        # Standard json fallback
+        monkeypatch.setattr(parset_module, "orjson", None)
+    with open(PARSET_FILE) as rf:
+        content = rf.read()
+    content = content.replace('Observation.name="VIR_A_TRANSIT"', 'Observation.name="Étoile"')
+    parset_file = tmp_path / "utf8.parset"
+    parset_file.write_text(content, encoding="utf-8")
+    Parset(str(parset_file)).to_json_old(path_name=str(tmp_path))
+    json_content, = _read_files([str(tmp_path / "utf8.json")])
+    # Non-ASCII characters are not escaped
+    assert "Étoile".encode("utf-8") in json_content
+# ============================================================= #
+
+
+# ============================================================= #
+# ------------- test_parsetuser_remove_numbeam_swap ----------- #
+# ============================================================= #
+def test_parsetuser_remove_numbeam_swap():
+    parset = ParsetUser()
+    parset.add_analog_beam(target="CygA")
+    parset.add_analog_beam(target="CasA")
+    for target in ["One", "Two", "Three"]:
+        parset.add_numerical_beam(0, target=target)
+    parset.add_numerical_beam(1, target="Four")
+
+    # The last numerical beam of the analog beam takes the removed place
+    parset.remove_numerical_beam(0, keep_order=False)
+    assert [numbeam["target"] for numbeam in parset.flat_numbeams] == ["Three", "Two", "Four"]
+    assert _beam_indices(parset) == [(0, 0), (1, 0), (2, 1)]
+
+    # Removing the last numerical beam of an analog beam
+    parset.remove_numerical_beam(2, keep_order=False)
+    assert [numbeam["target"] for numbeam in parset.flat_numbeams] == ["Three", "Two"]
+    assert _beam_indices(parset) == [(0, 0), (1, 0)]
+
+    # Default removal preserves the order
+    parset.remove_numerical_beam(0)
+    assert [numbeam["target"] for numbeam in parset.flat_numbeams] == ["Two"]
+    assert _beam_indices(parset) == [(0, 0)]
+    assert "Observation.nrBeams=1" in str(parset).splitlines()
+# ============================================================= #
+
+
+# ============================================================= #
+# ------------------- test_parse_parameters ------------------- #
+# ============================================================= #
+def test_parse_parameters():
+    assert _parse_parameters("TF: DF=3.05 DT=10.0 HAMM") == ("tf", {"df": "3.05", "dt": "10.0"})
+    assert _parse_parameters("TF: RAWRT") == ("tf", {"tf: rawrt": True})
+    assert _parse_parameters(
+        "FOLD: --TFOLD=10.737 --SRC=B1508+55  --DEFARADAY",
+        pulsar=True
+    ) == ("fold", {"tfold": "10.737 ", "src": "b1508+55  ", "fold:": True, "defaraday": True})
+# ============================================================= #
+
+
+# ============================================================= #
+# ---------------- test_parset_to_json_isolated --------------- #
+# ============================================================= #
+def test_parset_to_json_isolated():
+    parset = Parset(PARSET_FILE)
+    json_data = parset.to_json()
+    frequency = json_data["field_of_views"][0]["pointings"][0]["receiver"]["frequency"]
+    assert len(frequency) > 0
+    # Modifying a result must not affect the next ones
+    frequency.clear()
+    assert parset.to_json() == Parset(PARSET_FILE).to_json()
+    assert len(parset.to_json()["field_of_views"][0]["pointings"][0]["receiver"]["frequency"]) > 0
+# ============================================================= #
+
+
+# ============================================================= #
+# ---------------- test_parset_xst_pointings ------------------ #
+# ============================================================= #
+def test_parset_xst_pointings(tmp_path):
+    with open(PARSET_FILE) as rf:
+        content = rf.read()
+    content = content.replace("Output.xst_userfile=false", "Output.xst_userfile=true")
+    content += "Output.xst_sbList=[100..120]\n"
+    xst_parset_file = tmp_path / "xst.parset"
+    xst_parset_file.write_text(content)
+
+    json_data = Parset(str(xst_parset_file)).to_json()
+    xst_pointings = [
+        pointing
+        for fov in json_data["field_of_views"]
+        for pointing in fov["pointings"]
+        if pointing["center"]["obs_direction_type"] == "zenith_xst"
+    ]
+    assert len(xst_pointings) > 1
+    # Each XST pointing has its own frequency dictionaries
+    xst_pointings[0]["receiver"]["frequency"].clear()
+    assert len(xst_pointings[1]["receiver"]["frequency"]) == 1
+# ============================================================= #
+
+
+# ============================================================= #
+# -------------- test_parset_to_json_old_no_subband ----------- #
+# ============================================================= #
+def test_parset_to_json_old_no_subband(tmp_path):
+    # A TBD numerical beam (NICKEL) doesn't need its 'subbandList'
+    with open(PARSET_FILE) as rf:
+        content = rf.read()
+    content = content.replace("Beam[0].subbandList=[38..45]\n", "")
+    parset_file = tmp_path / "no_subband.parset"
+    parset_file.write_text(content)
+
+    json_data = Parset(str(parset_file)).to_json_old()
+    receivers = [
+        pointing["receiver"]["name"]
+        for fov in json_data["field_of_views"]
+        for pointing in fov["pointings"]
+        if pointing["idx"] == 0
+    ]
+    assert receivers == ["nickel"]
+# ============================================================= #
+
+
+# ============================================================= #
+# --------------- test_parsetuser_replaced_anabeam ------------ #
+# ============================================================= #
+def test_parsetuser_replaced_anabeam():
+    parset = ParsetUser()
+    parset.add_analog_beam(target="CygA")
+    parset.add_numerical_beam(0, target="CygA")
+    str(parset)
+    # Same shape, different analog beam (whatever the memory address)
+    new_anabeam = _AnalogBeamParsetBlock(target="CasA")
+    new_anabeam._add_numerical_beam(target="CasA")
+    parset.analog_beams[0] = new_anabeam
+    assert parset.flat_numbeams == new_anabeam.numerical_beams
+    assert "Beam[0].target=CasA" in str(parset).splitlines()
+# ============================================================= #
+
+
+# ============================================================= #
+# ---------------- test_parsetproperty_caches ----------------- #
+# ============================================================= #
+def test_parsetproperty_caches():
+    prop = _ParsetProperty({
+        "startTime": "2022-01-01T00:00:00Z",
+        "duration": "60",
+        "subbandList": "[10..12]"
+    })
+    assert parset_module._beam_times(prop)[3].sec == 60
+    freqs = parset_module._freq_dict_cached(prop)
+
+    # Every removal invalidates the caches
+    prop.pop("subbandList")
+    assert "subbandList" not in prop._freq_cache
+    del prop["duration"]
+    assert prop._time_cache is None
+    prop["duration"] = "10"
+    assert parset_module._beam_times(prop)[3].sec == 10
+    prop.popitem()
+    assert prop._time_cache is None
+    prop.clear()
+    assert len(prop) == 0
+
+    # In-place union parses the values and invalidates the caches
+    prop |= {"startTime": "2022-01-01T00:00:00Z", "duration": "30", "subbandList": "[10..12]"}
+    assert prop["subbandList"] == [10, 11, 12]
+    assert parset_module._beam_times(prop)[3].sec == 30
+    assert parset_module._freq_dict_cached(prop) == freqs
+    prop |= {"subbandList": "[20..22]", "duration": "40"}
+    assert parset_module._freq_dict_cached(prop) != freqs
+    assert parset_module._beam_times(prop)[3].sec == 40
+# ============================================================= #
+
+
+# ============================================================= #
+# ---------------- test_parset_to_json_fallback --------------- #
+# ============================================================= #
+@pytest.mark.skipif(parset_module.orjson is None, reason="orjson not installed")
+def test_parset_to_json_fallback(tmp_path, monkeypatch):
+    orjson_dir = tmp_path / "orjson"
+    json_dir = tmp_path / "json"
+    orjson_dir.mkdir()
+    json_dir.mkdir()
+    orjson_files = _single_json_files(orjson_dir)
+    # Standard json fallback
+    monkeypatch.setattr(parset_module, "orjson", None)
+    json_files = _single_json_files(json_dir)
+    assert _read_files(json_files) == _read_files(orjson_files)
+# ============================================================= #
+
+
+# ============================================================= #
+# ------------- test_parset_to_json_nickel_remote_ma ---------- #
+# ============================================================= #
+def test_parset_to_json_nickel_remote_ma(tmp_path):
+    # Pre-1.0 parset adding its own NICKEL pointing (no TBD beam)
+    with open(PARSET_FILES[1]) as rf:
+        content = rf.read()
+    content = content.replace("Beam[0].toDo=TBD", "Beam[0].toDo=dynamicspectrum")
+    parset_file = tmp_path / "nickel_pointing.parset"
+    parset_file.write_text(content)
+
+    json_data = Parset(str(parset_file)).to_json()
+    fov = json_data["field_of_views"][0]
+    assert any(pointing.get("name") == "nickel" for pointing in fov["pointings"])
+    # Remote Mini-Arrays are kept for NICKEL
+    assert {"value": 100} in fov["mini_arrays"]
+# ============================================================= #